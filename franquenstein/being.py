@@ -13,7 +13,31 @@ from __future__ import annotations
 import random
 import re
 import time
-from typing import Optional
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import TYPE_CHECKING, Optional
+
+from franquenstein.config import (
+    BEING_NAME,
+    GROWTH_LEVELS,
+    CURIOSITY_COOLDOWN_SECONDS,
+    CURIOSITY_EVERY_N_INTERACTIONS,
+    CURIOSITY_MAX_PER_HOUR,
+    LLM_AVAILABLE_TTL_SECONDS,
+    LLM_DEADLINE_SECONDS,
+    LLM_UNAVAILABLE_TTL_SECONDS,
+)
+from franquenstein.memory.memory import MemorySystem
+from franquenstein.learning.learner import Learner
+from franquenstein.growth.growth import GrowthSystem
+from franquenstein.neural import NeuralGraph, ResponseWeaver, Neurochemistry
+
+if TYPE_CHECKING:
+    from franquenstein.curiosity import CuriosityEngine
+    from franquenstein.growth.metrics import MetricsSnapshot
+    from franquenstein.reasoning import LocalLLMReasoner, ResponseCache
+
 
 STOP_WORDS_ES = {
     "el", "la", "los", "las", "un", "una", "unos", "unas",
@@ -26,19 +50,128 @@ STOP_WORDS_ES = {
     "sobre", "cuentame", "cuéntame", "dime", "sabes", "algo",
 }
 
-from franquenstein.config import (
-    BEING_NAME,
-    GROWTH_LEVELS,
-    CURIOSITY_COOLDOWN_SECONDS,
-    CURIOSITY_EVERY_N_INTERACTIONS,
-    CURIOSITY_MAX_PER_HOUR,
+_WORD_RE = re.compile(r"\w+")
+_NAME_RE = re.compile(
+    r"(?:my name is|me llamo|i'?m|soy|call me|llámame|i am|yo soy)\s+(\w+)",
+    re.IGNORECASE,
 )
-from franquenstein.memory.memory import MemorySystem
-from franquenstein.learning.learner import Learner
-from franquenstein.growth.growth import GrowthSystem
-from franquenstein.reasoning import LocalLLMReasoner
-from franquenstein.curiosity import CuriosityEngine
-from franquenstein.neural import NeuralGraph, ResponseWeaver, Neurochemistry
+
+_QUESTION_WORDS = frozenset({"what", "why", "how", "qué", "cómo"})
+_POS_WORDS = frozenset({
+    "good", "great", "awesome", "bien", "genial", "nice", "love",
+    "yes", "correct", "right", "sí", "exacto", "perfecto",
+})
+_NEG_WORDS = frozenset({
+    "bad", "wrong", "no", "mal", "error", "mistake",
+    "terrible", "horrible",
+})
+_GREETING_WORDS = frozenset({"hola", "hello", "hi", "hey", "buenos", "buenas"})
+
+# Phrase detectors: one alternation per category scans the text once
+# (plain substring semantics, matching the old `any(p in text ...)` checks).
+_GREETING_PHRASE_RE = re.compile("good morning|good night")
+_IDENTITY_RE = re.compile("who are you|what are you|quién eres|qué eres")
+_FEELING_RE = re.compile("how are you|cómo estás|how do you feel")
+_KNOWLEDGE_RE = re.compile("what do you know|qué sabes")
+
+_EXCLUDED_NAMES = frozenset({
+    "yo", "tú", "tu", "el", "ella", "ello", "nosotros", "vosotros",
+    "ellos", "ellas", "usted", "ustedes", "nadie", "alguien",
+    "todos", "quien", "quién", "cual", "cuál",
+    # Common non-name words
+    "a", "the", "an", "just", "not", "very", "so", "here",
+})
+
+_BABY_REACTIONS = (
+    "Ooh!", "Hmm?", "Ah!", "...", "?",
+    "*looks around curiously*", "*tilts head*",
+    "*babbles*", "*reaches out*",
+)
+_GREETING_TEMPLATES = ("Hello{name}!", "Hi{name}! 😊", "Hey{name}!")
+_QUESTION_TEMPLATES = (
+    "What does '{word}' really mean?",
+    "Can you tell me more about '{word}'?",
+    "Why is '{word}' important?",
+)
+_CURIOUS_TEMPLATES = (
+    "'{word}'... interesting! Tell me more?",
+    "I'm curious about '{word}'. What does it mean to you?",
+    "Hmm, '{word}'. I'm still learning about that!",
+)
+_LISTENING_REPLIES = (
+    "Tell me more!",
+    "I'm listening and learning...",
+    "Interesting! What else?",
+    "*thinks carefully*",
+)
+
+
+# ─── Level-0 babble strategies: (rng, words) -> response ─────
+
+def _echo_last(rng: random.Random, words: tuple[str, ...]) -> str:
+    return f"{words[-1]}? {words[-1]}!" if words else "..."
+
+
+def _echo_random(rng: random.Random, words: tuple[str, ...]) -> str:
+    return f"{rng.choice(words)}... {rng.choice(words)}!" if words else "?"
+
+
+def _react(rng: random.Random, words: tuple[str, ...]) -> str:
+    return _BABY_REACTIONS[rng.randrange(len(_BABY_REACTIONS))]
+
+
+def _babble_repeat(rng: random.Random, words: tuple[str, ...]) -> str:
+    """Baby-style attempt to repeat — may get words wrong."""
+    if not words:
+        return "..."
+    # Pick 1-3 words and maybe jumble them
+    n = min(len(words), rng.randint(1, 3))
+    selected = rng.sample(words, n)
+    return " ".join(selected) + "?"
+
+
+_BABY_STRATEGIES = (_echo_last, _echo_random, _react, _babble_repeat)
+
+# Chemistry persistence: skip sub-epsilon drift, but flush every N interactions
+_CHEM_PERSIST_EPSILON = 1e-3
+_CHEM_PERSIST_EVERY = 20
+
+# Curiosity day/hour counters live in RAM and are flushed every N runs
+_CURIOSITY_FLUSH_EVERY = 3
+
+
+@dataclass(slots=True)
+class Perception:
+    """One input, tokenized once and shared by every step of the cycle."""
+
+    raw: str
+    lower: str                      # lower-cased and stripped
+    tokens: tuple[str, ...]         # whitespace split of `lower`
+    terms: frozenset[str]           # bare words of `lower` (punctuation dropped)
+    meaningful: tuple[str, ...]     # key words without stop words
+    concepts: tuple[str, ...]       # `meaningful` deduplicated, order kept
+
+    @classmethod
+    def from_text(cls, text: str) -> "Perception":
+        lower = text.lower().strip()
+        meaningful = tuple(_meaningful_words(text))
+        return cls(
+            raw=text,
+            lower=lower,
+            tokens=tuple(lower.split()),
+            terms=frozenset(_WORD_RE.findall(lower)),
+            meaningful=meaningful,
+            concepts=tuple(dict.fromkeys(meaningful)),
+        )
+
+
+def _meaningful_words(text: str) -> list[str]:
+    """Extract semantically meaningful words (stop-words filtered)."""
+    # _extract_key_words already lower-cases and strips punctuation
+    return [
+        w for w in MemorySystem._extract_key_words(text)
+        if len(w) >= 3 and w not in STOP_WORDS_ES
+    ]
 
 
 class Being:
@@ -60,10 +193,15 @@ class Being:
 
         # Current interaction state
         self._current_input: str = ""
+        self._perc: Perception = Perception.from_text("")
+        self._word_ids: list[int] = []
         self._current_emotion: str = "curiosidad"
         self._current_emotion_intensity: float = 0.6
         self._last_response: str = ""
         self._last_episode_id: int = 0
+        self._cycle_cache: dict = {}
+        self._closed = False
+        self._rng = random.Random()
 
         # Load persistent state
         self._user_name: str = self.memory.load_state("user_name", "")
@@ -71,8 +209,12 @@ class Being:
             self.memory.load_state("total_interactions", "0")
         )
 
-        # Local LLM reasoner (used at Level 2+ when available)
-        self._llm_reasoner = LocalLLMReasoner(model="phi3:mini")
+        # Local LLM reasoner (used at Level 2+ when available), built lazily
+        self._llm: Optional[LocalLLMReasoner] = None
+        self._llm_executor: Optional[ThreadPoolExecutor] = None
+        self._llm_available_until: float = 0.0
+        self._llm_unavailable_until: float = 0.0
+        self._response_cache_instance: Optional[ResponseCache] = None
 
         # Neural graph brain (LLM-independent reasoning substrate)
         self.neural = NeuralGraph(self.memory._conn)
@@ -86,11 +228,17 @@ class Being:
             "oxytocin": self.memory.load_state("chem_oxytocin", "0.3"),
         }
         self.chemistry = Neurochemistry.from_state(chem_state)
+        self._chem_persisted: dict[str, float] = self.chemistry.to_state()
 
-        self.curiosity = CuriosityEngine(self.memory, self._llm_reasoner)
+        self._curiosity: Optional[CuriosityEngine] = None
         self._last_curiosity_ts: float = 0.0
-        self._curiosity_timestamps: list[float] = []
+        self._curiosity_timestamps: deque[float] = deque(maxlen=CURIOSITY_MAX_PER_HOUR)
         self._curiosity_runs_total: int = int(self.memory.load_state("curiosity_runs_total", "0"))
+        self._curiosity_counts: dict[str, int] = {
+            key: int(self.memory.load_state(key, "0"))
+            for key in self._curiosity_keys(time.time())
+        }
+        self._curiosity_unflushed: int = 0
 
     # ─── Cognitive Cycle ─────────────────────────────────────
 
@@ -100,27 +248,30 @@ class Being:
         Analyzes the input, determines emotion, and gathers context.
         """
         self._current_input = input_text
+        self._perc = perc = Perception.from_text(input_text)
+        self._cycle_cache.clear()
 
         # Determine emotional response to the input
         self._current_emotion, self._current_emotion_intensity = (
-            self._detect_emotion(input_text)
+            self._detect_emotion(perc)
         )
 
         # Feed neural graph with co-occurring input concepts
-        words = self._extract_meaningful_words(input_text)
-        for w in words:
-            self.neural.get_or_create_node(w, node_type="concept")
+        words = perc.concepts
+        self._word_ids = self.neural.intern_many(words, node_type="concept")
 
         # Neuromodulation: novelty/affective event updates chemistry
-        if len(words) >= 3:
+        if len(perc.meaningful) >= 3:
             self.chemistry.modulate("novel_input")
         if self._current_emotion in ("satisfaccion", "alegria"):
             self.chemistry.modulate("social_trust")
         elif self._current_emotion in ("frustracion", "confusion"):
             self.chemistry.modulate("unanswered")
 
-        params = self.chemistry.get_graph_params()
-        self.neural.hebbian_learn(words, plasticity=float(params.get("plasticity", 1.0)))
+        params = self._cycle_value("graph_params", self.chemistry.get_graph_params)
+        self.neural.hebbian_learn_ids(
+            self._word_ids, plasticity=float(params.get("plasticity", 1.0))
+        )
 
         # Gather relevant knowledge
         knowledge = self.learner.get_relevant_knowledge(input_text)
@@ -137,12 +288,13 @@ class Being:
         Uses capabilities, memory, and patterns to formulate
         the best response the being can give at its current level.
         """
-        input_text = self._current_input
+        perc = self._perc
+        input_text = perc.raw
         level = self.growth.level
 
         # Preserve explicit identity/name introductions before neural/LLM routing.
-        if self._detect_name_introduction(input_text.lower().strip()):
-            return self._generate_response(input_text, level)
+        if self._detect_name_introduction(perc.lower):
+            return self._generate_response(perc, level)
 
         # Check if we have a learned response
         learned = self.learner.suggest_response(input_text)
@@ -150,15 +302,17 @@ class Being:
             return learned
 
         # Neural graph reasoning (LLM-independent) before calling LLM.
-        words = self._extract_meaningful_words(input_text)
+        words = perc.concepts
         if words:
-            graph_params = self.chemistry.get_graph_params()
-            activation = self.neural.activate(words, params=graph_params)
+            graph_params = self._cycle_value("graph_params", self.chemistry.get_graph_params)
+            activation = self.neural.activate_ids(
+                self._word_ids, params=graph_params, trigger=", ".join(words)
+            )
             neural_response = self.weaver.weave(
                 activation=activation,
                 input_text=input_text,
-                graph_stats=self.neural.get_stats(),
-                tone=self.chemistry.get_tone(),
+                graph_stats=self._cycle_value("graph_stats", self.neural.get_stats),
+                tone=self._cycle_value("tone", self.chemistry.get_tone),
             )
             if neural_response:
                 return neural_response
@@ -167,7 +321,12 @@ class Being:
         # If anything fails, we gracefully fallback to native behavior.
         if level >= 2:
             try:
-                if self._llm_reasoner.is_available():
+                cached = self._response_cache.get(
+                    input_text, self._current_emotion, user=self._user_name
+                )
+                if cached:
+                    return cached
+                if self._llm_is_available():
                     working_items = [
                         {
                             "input_text": e.input_text,
@@ -175,7 +334,7 @@ class Being:
                         }
                         for e in self.memory.working.get_recent()
                     ]
-                    known = [c.concept for c in self.memory.semantic.get_confident(min_confidence=0.2, limit=50)]
+                    known = self.memory.semantic.get_known_concepts(min_confidence=0.2, limit=50)
                     best_eps = self.memory.episodic.recall_best_feedback(
                         min_feedback=0.5,
                         limit=5,
@@ -186,7 +345,7 @@ class Being:
                         if e.output_text
                     ]
 
-                    llm_response = self._llm_reasoner.generate(
+                    llm_response = self._llm_generate(
                         input_text=input_text,
                         level_name=self.level_name,
                         mood=self._current_emotion,
@@ -196,6 +355,10 @@ class Being:
                         user_name=self._user_name,
                     )
                     if llm_response:
+                        self._response_cache.put(
+                            input_text, self._current_emotion, llm_response,
+                            user=self._user_name,
+                        )
                         return llm_response
             except Exception:
                 # Silent fallback keeps backward compatibility/stability.
@@ -203,12 +366,12 @@ class Being:
 
         # Smarter deterministic fallback for Level 2 when LLM is unavailable.
         if level >= 2:
-            fallback = self._fallback_level2_response(input_text)
+            fallback = self._fallback_level2_response(perc)
             if fallback:
                 return fallback
 
         # Generate response based on current capabilities
-        response = self._generate_response(input_text, level)
+        response = self._generate_response(perc, level)
         return response
 
     def act(self, response: str) -> str:
@@ -226,9 +389,6 @@ class Being:
         Stores the experience and updates patterns.
         """
         self._interaction_count += 1
-        self.memory.save_state(
-            "total_interactions", str(self._interaction_count)
-        )
 
         result = self.learner.learn_from_interaction(
             input_text=self._current_input,
@@ -241,18 +401,30 @@ class Being:
 
         # Neurochemistry homeostasis + persistence
         self.chemistry.homeostasis(speed=0.02)
-        state = self.chemistry.to_state()
-        self.memory.save_state("chem_dopamine", str(state["dopamine"]))
-        self.memory.save_state("chem_serotonin", str(state["serotonin"]))
-        self.memory.save_state("chem_norepinephrine", str(state["norepinephrine"]))
-        self.memory.save_state("chem_cortisol", str(state["cortisol"]))
-        self.memory.save_state("chem_oxytocin", str(state["oxytocin"]))
+        state = {"total_interactions": str(self._interaction_count)}
+        state.update(self._chemistry_state_delta(
+            force=self._interaction_count % _CHEM_PERSIST_EVERY == 0
+        ))
+        self.memory.save_state_many(state)
 
         return result
 
-    def grow(self) -> Optional[dict]:
+    def grow(self, snap: Optional[MetricsSnapshot] = None) -> Optional[dict]:
         """Step 5: Grow — check for level-ups after learning."""
-        return self.growth.check_growth()
+        return self.growth.check_growth(snap)
+
+    def _chemistry_state_delta(self, force: bool = False) -> dict[str, str]:
+        """Chemistry keys that moved more than epsilon since the last save.
+
+        With force=True every key is returned. The returned values are
+        recorded as persisted, so the caller must write them.
+        """
+        delta: dict[str, str] = {}
+        for key, value in self.chemistry.to_state().items():
+            if force or abs(value - self._chem_persisted[key]) > _CHEM_PERSIST_EPSILON:
+                delta[f"chem_{key}"] = str(value)
+                self._chem_persisted[key] = value
+        return delta
 
     # ─── Full Interaction Cycle ──────────────────────────────
 
@@ -273,10 +445,11 @@ class Being:
         # 4. Learn
         learning = self.learn()
 
-        # 5. Grow
-        growth = self.grow()
+        # 5. Grow — one metrics snapshot serves every growth check this turn
+        growth = self.grow(self.growth.snapshot())
 
         curiosity = self._maybe_run_autonomous_curiosity()
+        self._cycle_cache.clear()
 
         return {
             "response": response,
@@ -289,15 +462,13 @@ class Being:
 
     # ─── Response Generation ─────────────────────────────────
 
-    def _generate_response(self, input_text: str, level: int) -> str:
+    def _generate_response(self, perc: Perception, level: int) -> str:
         """Generate a response based on current capabilities.
 
         Each level adds more sophisticated response strategies.
         """
-        text_lower = input_text.lower().strip()
-
         # ── Check for name introduction ──
-        name = self._detect_name_introduction(text_lower)
+        name = self._detect_name_introduction(perc.lower)
         if name:
             self._user_name = name
             self.memory.save_state("user_name", name)
@@ -310,98 +481,74 @@ class Being:
 
         # ── Level 0: Baby — echo and babble ──
         if level == 0:
-            return self._baby_response(text_lower)
+            return self._baby_response(perc)
 
         # ── Level 1: Infant — keyword recognition + simple responses ──
         if level >= 1:
-            response = self._infant_response(text_lower)
+            response = self._infant_response(perc)
             if response:
                 return response
 
         # ── Level 2: Child — associations + questions ──
         if level >= 2:
-            response = self._child_response(text_lower)
+            response = self._child_response(perc)
             if response:
                 return response
 
         # ── Level 3+: Adolescent+ — reasoning ──
         if level >= 3:
-            response = self._adolescent_response(text_lower)
+            response = self._adolescent_response(perc)
             if response:
                 return response
 
         # Fallback to best available response
         if level == 0:
-            return self._baby_response(text_lower)
+            return self._baby_response(perc)
         elif level == 1:
-            return self._infant_response(text_lower) or self._baby_response(text_lower)
+            return self._infant_response(perc) or self._baby_response(perc)
         else:
-            return self._curious_response(text_lower)
+            return self._curious_response(perc)
 
-    def _baby_response(self, text: str) -> str:
+    def _baby_response(self, perc: Perception) -> str:
         """Level 0 behavior: echo, babble, simple reactions."""
-        words = text.split()
-
-        responses = [
-            # Echo the last word
-            lambda: f"{words[-1]}? {words[-1]}!" if words else "...",
-            # Echo a random word
-            lambda: f"{random.choice(words)}... {random.choice(words)}!" if words else "?",
-            # Simple reactions
-            lambda: random.choice([
-                "Ooh!", "Hmm?", "Ah!", "...", "?",
-                "*looks around curiously*", "*tilts head*",
-                "*babbles*", "*reaches out*",
-            ]),
-            # Attempt to repeat (with errors)
-            lambda: self._babble_repeat(text),
-        ]
-
-        return random.choice(responses)()
-
-    def _infant_response(self, text: str) -> Optional[str]:
+        strategy = _BABY_STRATEGIES[self._rng.getrandbits(2)]
+        return strategy(self._rng, perc.tokens)
+
+    def _infant_response(self, perc: Perception) -> Optional[str]:
         """Level 1 behavior: recognize keywords, remember names."""
+        text = perc.lower
+
         # Greetings
-        greetings = ["hola", "hello", "hi", "hey", "buenos", "buenas", "good morning", "good night"]
-        if any(g in text for g in greetings):
+        if not _GREETING_WORDS.isdisjoint(perc.terms) or _GREETING_PHRASE_RE.search(text):
             name_part = f", {self._user_name}" if self._user_name else ""
-            return random.choice([
-                f"Hello{name_part}!",
-                f"Hi{name_part}! 😊",
-                f"Hey{name_part}!",
-            ])
+            return self._rng.choice(_GREETING_TEMPLATES).format(name=name_part)
 
         # Questions about identity
-        if any(q in text for q in ["who are you", "what are you", "quién eres", "qué eres"]):
+        if _IDENTITY_RE.search(text):
             return f"I am {BEING_NAME}. I am learning!"
 
         # Questions about feelings
-        if any(q in text for q in ["how are you", "cómo estás", "how do you feel"]):
+        if _FEELING_RE.search(text):
             mood = self.memory.emotional.get_mood()
             return f"I feel... {mood}. Every conversation teaches me something new!"
 
         # "What do you know?"
-        if any(q in text for q in ["what do you know", "qué sabes"]):
+        if _KNOWLEDGE_RE.search(text):
             vocab = self.memory.semantic.vocabulary_size()
             return f"I know {vocab} concepts so far! I'm learning more every day."
 
         return None
 
-    def _fallback_level2_response(self, text: str) -> Optional[str]:
+    def _fallback_level2_response(self, perc: Perception) -> Optional[str]:
         """Smarter Level-2 fallback when LLM path is unavailable.
 
         Uses memory signals in a deterministic order before random child behavior.
         """
-        words = self._extract_meaningful_words(text)
+        words = list(perc.meaningful)
 
         # 1) Prefer best known concept with highest confidence
-        best_concept = None
-        best_score = -1.0
-        for w in words:
-            c = self.memory.semantic.get_concept(w)
-            if c and c.confidence > best_score:
-                best_concept = c
-                best_score = c.confidence
+        concepts = self.memory.semantic.get_concepts_by_names(words)
+        best_concept = concepts[0] if concepts else None
         if best_concept:
             if best_concept.definition:
                 return (
@@ -418,42 +565,36 @@ class Being:
         # 2) State-dependent retrieval fallback
         # High cortisol -> prefer recent concrete episodes (defensive/focused)
         # High serotonin -> allow broader semantic reflection (already handled above)
-        if self.chemistry.cortisol >= 0.45:
-            for w in words[:2]:
-                episodes = self.memory.episodic.search(w, limit=1)
-                if episodes:
-                    ep = episodes[0]
-                    return (
-                        f"Ahora mismo me apoyo en algo reciente: '{ep.input_text[:80]}'. "
-                        "¿Quieres que avancemos paso a paso?"
-                    )
-        else:
-            for w in words[:2]:
-                episodes = self.memory.episodic.search(w, limit=1)
-                if episodes:
-                    ep = episodes[0]
-                    return (
-                        f"Esto se parece a algo que hablamos: '{ep.input_text[:80]}'. "
-                        "¿Quieres que lo usemos como base?"
-                    )
+        episodes = self.memory.episodic.search_any(words[:2], limit=1)
+        if episodes:
+            ep = episodes[0]
+            if self.chemistry.cortisol >= 0.45:
+                return (
+                    f"Ahora mismo me apoyo en algo reciente: '{ep.input_text[:80]}'. "
+                    "¿Quieres que avancemos paso a paso?"
+                )
+            return (
+                f"Esto se parece a algo que hablamos: '{ep.input_text[:80]}'. "
+                "¿Quieres que lo usemos como base?"
+            )
 
         return None
 
-    def _child_response(self, text: str) -> Optional[str]:
+    def _child_response(self, perc: Perception) -> Optional[str]:
         """Level 2 behavior: associations, questions, past references."""
-        words = self._extract_meaningful_words(text)
+        words = perc.meaningful
 
         # Try to make associations
-        for word in words:
+        for word in perc.concepts:
             concept = self.memory.semantic.get_concept(word)
             if concept and concept.associations:
-                assoc = random.choice(concept.associations)
+                assoc = self._rng.choice(concept.associations)
                 return f"'{word}'... that reminds me of '{assoc}'! Are they connected?"
 
         # Reference past interactions
-        if self._interaction_count > 10 and random.random() < 0.3:
+        if self._interaction_count > 10 and self._rng.random() < 0.3:
             episodes = self.memory.episodic.search(
-                random.choice(words) if words else text[:20],
+                self._rng.choice(words) if words else perc.lower[:20],
                 limit=3,
             )
             if episodes:
@@ -461,22 +602,20 @@ class Being:
                 return f"This reminds me of when you said '{ep.input_text[:40]}...' I remember that!"
 
         # Ask questions (curiosity)
-        if random.random() < 0.4 and words:
-            return random.choice([
-                f"What does '{random.choice(words)}' really mean?",
-                f"Can you tell me more about '{random.choice(words)}'?",
-                f"Why is '{random.choice(words)}' important?",
-            ])
+        if self._rng.random() < 0.4 and words:
+            template = self._rng.choice(_QUESTION_TEMPLATES)
+            return template.format(word=self._rng.choice(words))
 
         return None
 
-    def _adolescent_response(self, text: str) -> Optional[str]:
+    def _adolescent_response(self, perc: Perception) -> Optional[str]:
         """Level 3+ behavior: basic reasoning, preferences."""
-        words = self._extract_meaningful_words(text)
+        words = perc.meaningful
 
         # Express preferences based on emotional memory
-        for word in words:
-            dominant = self.memory.emotional.get_dominant_emotion(word)
+        dominant_by_word = self.memory.emotional.get_dominant_emotions(perc.concepts)
+        for word in perc.concepts:
+            dominant = dominant_by_word.get(word)
             if dominant and dominant.emotion != "neutral":
                 if dominant.emotion in ("satisfaccion", "alegria"):
                     return f"'{word}'! That's something I always enjoy exploring."
@@ -485,59 +624,93 @@ class Being:
 
         # Reference reflections
         reflections = self.learner.metacognition.get_recent_reflections(3)
-        if reflections and random.random() < 0.3:
-            r = random.choice(reflections)
+        if reflections and self._rng.random() < 0.3:
+            r = self._rng.choice(reflections)
             return f"I've been thinking... {r.insight}"
 
         return None
 
-    def _curious_response(self, text: str) -> str:
+    def _curious_response(self, perc: Perception) -> str:
         """Fallback: express curiosity about the input."""
-        words = self._extract_meaningful_words(text)
+        words = perc.meaningful
         if words:
-            word = random.choice(words)
-            return random.choice([
-                f"'{word}'... interesting! Tell me more?",
-                f"I'm curious about '{word}'. What does it mean to you?",
-                f"Hmm, '{word}'. I'm still learning about that!",
-            ])
-        return random.choice([
-            "Tell me more!",
-            "I'm listening and learning...",
-            "Interesting! What else?",
-            "*thinks carefully*",
-        ])
+            word = self._rng.choice(words)
+            return self._rng.choice(_CURIOUS_TEMPLATES).format(word=word)
+        return self._rng.choice(_LISTENING_REPLIES)
+
+    # ─── Local LLM ───────────────────────────────────────────
+
+    def _llm_is_available(self) -> bool:
+        """Availability probe cached in both directions.
+
+        A successful probe is trusted for LLM_AVAILABLE_TTL_SECONDS. A failed
+        probe (or a generation that missed its deadline) opens the breaker
+        for LLM_UNAVAILABLE_TTL_SECONDS. Either way the HTTP health check
+        runs at most once per window instead of on every interaction.
+        """
+        now = time.monotonic()
+        if now < self._llm_available_until:
+            return True
+        if now < self._llm_unavailable_until:
+            return False
+        if self._llm_reasoner.is_available():
+            self._llm_available_until = now + LLM_AVAILABLE_TTL_SECONDS
+            return True
+        self._llm_unavailable_until = now + LLM_UNAVAILABLE_TTL_SECONDS
+        return False
+
+    def _llm_mark_unavailable(self) -> None:
+        self._llm_available_until = 0.0
+        self._llm_unavailable_until = time.monotonic() + LLM_UNAVAILABLE_TTL_SECONDS
+
+    def _llm_generate(self, **kwargs) -> str:
+        """Run the LLM on a worker thread with a hard wall-clock deadline.
+
+        Returns an empty string on timeout so think() falls through to the
+        deterministic fallback. Generation errors propagate to the caller.
+        A failed generation drops the cached availability, so the next call
+        probes again.
+        """
+        if self._llm_executor is None:
+            self._llm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm")
+        future = self._llm_executor.submit(self._llm_reasoner.generate, **kwargs)
+        try:
+            return future.result(timeout=LLM_DEADLINE_SECONDS)
+        except FuturesTimeoutError:
+            future.cancel()
+            self._llm_mark_unavailable()
+            return ""
+        except Exception:
+            self._llm_available_until = 0.0
+            raise
 
     # ─── Helpers ─────────────────────────────────────────────
 
+    def _cycle_value(self, key: str, compute):
+        """Return a per-cycle cached value, computing it on first use.
 
-    def _extract_meaningful_words(self, text: str) -> list[str]:
-        """Extract semantically meaningful words (stop-words filtered)."""
-        words = self.memory._extract_key_words(text)
-        return [w for w in words if w and w.lower() not in STOP_WORDS_ES and len(w) >= 3]
+        Chemistry and graph reads are stable between perceive() and the
+        end of interact(), so each one is evaluated at most once per cycle.
+        """
+        if key not in self._cycle_cache:
+            self._cycle_cache[key] = compute()
+        return self._cycle_cache[key]
 
-    def _detect_emotion(self, text: str) -> tuple[str, float]:
+    def _detect_emotion(self, perc: Perception) -> tuple[str, float]:
         """Detect the appropriate emotional response to input."""
-        text_lower = text.lower()
+        text = perc.raw
+        tokens = perc.terms
 
         # Question → curiosity
-        if "?" in text or any(
-            q in text_lower for q in ["what", "why", "how", "qué", "por qué", "cómo"]
-        ):
+        if "?" in text or not _QUESTION_WORDS.isdisjoint(tokens):
             return "curiosidad", 0.7
 
         # Positive signals
-        if any(w in text_lower for w in [
-            "good", "great", "awesome", "bien", "genial", "nice", "love",
-            "yes", "correct", "right", "sí", "exacto", "perfecto",
-        ]):
+        if not _POS_WORDS.isdisjoint(tokens):
             return "satisfaccion", 0.7
 
         # Negative signals
-        if any(w in text_lower for w in [
-            "bad", "wrong", "no", "mal", "error", "mistake",
-            "terrible", "horrible",
-        ]):
+        if not _NEG_WORDS.isdisjoint(tokens):
             return "frustracion", 0.5
 
         # Exclamation → surprise
@@ -545,42 +718,19 @@ class Being:
             return "sorpresa", 0.6
 
         # Novel/long input → curiosity
-        if len(text.split()) > 10:
+        if len(perc.tokens) > 10:
             return "curiosidad", 0.8
 
         return "neutral", 0.5
 
     def _detect_name_introduction(self, text: str) -> Optional[str]:
         """Try to detect if the user is telling us their name."""
-        EXCLUDED_NAMES = {"yo", "tú", "tu", "el", "ella", "ello", "nosotros", "vosotros",
-                          "ellos", "ellas", "usted", "ustedes", "nadie", "alguien",
-                          "todos", "quien", "quién", "cual", "cuál"}
-
-        patterns = [
-            r"(?:my name is|me llamo|i'?m|soy)\s+(\w+)",
-            r"(?:call me|llámame)\s+(\w+)",
-            r"(?:i am|yo soy)\s+(\w+)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                name = match.group(1).capitalize()
-                # Filter out common non-name words
-                non_names = {"a", "the", "an", "just", "not", "very", "so", "here"}
-                if name.lower() not in non_names and name.lower() not in EXCLUDED_NAMES and len(name) > 1:
-                    return name
+        for match in _NAME_RE.finditer(text):
+            name = match.group(1).capitalize()
+            if name.lower() not in _EXCLUDED_NAMES and len(name) > 1:
+                return name
         return None
 
-    def _babble_repeat(self, text: str) -> str:
-        """Baby-style attempt to repeat — may get words wrong."""
-        words = text.split()
-        if not words:
-            return "..."
-        # Pick 1-3 words and maybe jumble them
-        n = min(len(words), random.randint(1, 3))
-        selected = random.sample(words, n)
-        return " ".join(selected) + "?"
-
     # ─── Feedback Interface ──────────────────────────────────
 
     def give_feedback(self, score: float) -> Optional[dict]:
@@ -595,15 +745,21 @@ class Being:
         # Reinforce neural response pathways on positive feedback
         if score > 0:
             self.chemistry.modulate("feedback_positive")
-            input_words = self._extract_meaningful_words(self._current_input)
-            response_words = self._extract_meaningful_words(self._last_response)
-            for iw in input_words:
-                for rw in response_words:
-                    if iw != rw:
-                        self.neural.connect(iw, rw, syn_type="response")
+            input_words = self._perc.meaningful
+            response_words = _meaningful_words(self._last_response)
+            self.neural.connect_many(
+                ((iw, rw) for iw in input_words for rw in response_words),
+                syn_type="response",
+            )
 
         if score < 0:
             self.chemistry.modulate("feedback_negative")
+            # Never serve a rejected answer again from the LLM cache
+            if self._response_cache_instance is not None:
+                self._response_cache.discard(
+                    self._current_input, self._current_emotion,
+                    user=self._user_name, response=self._last_response,
+                )
 
         return {"reflection": reflection.insight if reflection else None}
 
@@ -622,19 +778,19 @@ class Being:
             self._curiosity_timestamps.append(now)
             self._curiosity_runs_total += 1
 
-            # Persist curiosity metrics (total + per day/hour) in being_state
-            day_key = time.strftime("curiosity_runs_day_%Y%m%d", time.localtime(now))
-            hour_key = time.strftime("curiosity_runs_hour_%Y%m%d_%H", time.localtime(now))
-            day_count = int(self.memory.load_state(day_key, "0")) + 1
-            hour_count = int(self.memory.load_state(hour_key, "0")) + 1
-            self.memory.save_state("curiosity_runs_total", str(self._curiosity_runs_total))
-            self.memory.save_state(day_key, str(day_count))
-            self.memory.save_state(hour_key, str(hour_count))
-            result["persisted"] = {"day_key": day_key, "day_count": day_count, "hour_key": hour_key, "hour_count": hour_count}
+            # Curiosity metrics (total + per day/hour), flushed to being_state in batches
+            day_key, hour_key = self._curiosity_keys(now)
+            day_count = self._bump_curiosity_count(day_key)
+            hour_count = self._bump_curiosity_count(hour_key)
+            self._curiosity_unflushed += 1
+            if self._curiosity_unflushed >= _CURIOSITY_FLUSH_EVERY:
+                self._flush_curiosity_counts()
+            # Counts may still be waiting for the next batched flush
+            result["counters"] = {"day_key": day_key, "day_count": day_count, "hour_key": hour_key, "hour_count": hour_count}
 
         result["metrics"] = {
             "runs_total": self._curiosity_runs_total,
-            "runs_last_hour": len([t for t in self._curiosity_timestamps if t >= time.time() - 3600]),
+            "runs_last_hour": self._prune_curiosity_timestamps(time.time()),
         }
         return result
 
@@ -643,11 +799,47 @@ class Being:
         if self._last_curiosity_ts and (now - self._last_curiosity_ts) < CURIOSITY_COOLDOWN_SECONDS:
             return False
 
+        return self._prune_curiosity_timestamps(now) < CURIOSITY_MAX_PER_HOUR
+
+    @staticmethod
+    def _curiosity_keys(now: float) -> tuple[str, str]:
+        """being_state keys for the day and hour containing `now`."""
+        local = time.localtime(now)
+        return (
+            time.strftime("curiosity_runs_day_%Y%m%d", local),
+            time.strftime("curiosity_runs_hour_%Y%m%d_%H", local),
+        )
+
+    def _bump_curiosity_count(self, key: str) -> int:
+        if key not in self._curiosity_counts:
+            # New day/hour since startup: resume from whatever was persisted
+            self._curiosity_counts[key] = int(self.memory.load_state(key, "0"))
+        self._curiosity_counts[key] += 1
+        return self._curiosity_counts[key]
+
+    def _curiosity_state(self) -> dict[str, str]:
+        """Pending curiosity counters as being_state values."""
+        if not self._curiosity_unflushed:
+            return {}
+        state = {"curiosity_runs_total": str(self._curiosity_runs_total)}
+        state.update((k, str(v)) for k, v in self._curiosity_counts.items())
+        return state
+
+    def _flush_curiosity_counts(self) -> None:
+        self.memory.save_state_many(self._curiosity_state())
+        self._curiosity_unflushed = 0
+        # Only the current day/hour can still be incremented
+        current = set(self._curiosity_keys(time.time()))
+        for key in [k for k in self._curiosity_counts if k not in current]:
+            del self._curiosity_counts[key]
+
+    def _prune_curiosity_timestamps(self, now: float) -> int:
+        """Drop runs older than one hour and return how many remain."""
         one_hour_ago = now - 3600
-        self._curiosity_timestamps = [t for t in self._curiosity_timestamps if t >= one_hour_ago]
-        if len(self._curiosity_timestamps) >= CURIOSITY_MAX_PER_HOUR:
-            return False
-        return True
+        timestamps = self._curiosity_timestamps
+        while timestamps and timestamps[0] < one_hour_ago:
+            timestamps.popleft()
+        return len(timestamps)
 
     def _maybe_run_autonomous_curiosity(self) -> dict | None:
         """Periodically run curiosity in autonomous mode with throttling.
@@ -698,9 +890,57 @@ class Being:
     def chemistry_state(self) -> dict:
         return self.chemistry.to_state()
 
+    # Level 2+ subsystems are only reached from the LLM and curiosity paths,
+    # so Level 0/1 sessions never import or construct them.
+
+    @property
+    def _llm_reasoner(self) -> LocalLLMReasoner:
+        if self._llm is None:
+            from franquenstein.reasoning import LocalLLMReasoner
+            self._llm = LocalLLMReasoner(model="phi3:mini")
+        return self._llm
+
+    @_llm_reasoner.setter
+    def _llm_reasoner(self, reasoner: LocalLLMReasoner) -> None:
+        self._llm = reasoner
+        self._llm_available_until = 0.0
+        self._llm_unavailable_until = 0.0
+        self._curiosity = None  # rebuilt around the new reasoner
+
+    @property
+    def _response_cache(self) -> ResponseCache:
+        if self._response_cache_instance is None:
+            from franquenstein.reasoning import ResponseCache
+            self._response_cache_instance = ResponseCache()
+        return self._response_cache_instance
+
+    @property
+    def curiosity(self) -> CuriosityEngine:
+        if self._curiosity is None:
+            from franquenstein.curiosity import CuriosityEngine
+            self._curiosity = CuriosityEngine(self.memory, self._llm_reasoner)
+        return self._curiosity
+
     def shutdown(self) -> None:
-        """Save state and close connections."""
-        self.memory.save_state("total_interactions", str(self._interaction_count))
+        """Save state and close connections. Safe to call more than once.
+
+        Every in-memory counter is flushed in a single transaction.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._llm_executor is not None:
+            self._llm_executor.shutdown(wait=False, cancel_futures=True)
+            self._llm_executor = None
+        if self._curiosity is not None:
+            self._curiosity.close()
+
+        final = {"total_interactions": str(self._interaction_count)}
         if self._user_name:
-            self.memory.save_state("user_name", self._user_name)
+            final["user_name"] = self._user_name
+        final.update(self._chemistry_state_delta(force=True))
+        final.update(self._curiosity_state())
+        self.memory.save_state_many(final)
+        self._curiosity_unflushed = 0
+        self.learner.close()
         self.memory.close()
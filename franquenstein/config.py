@@ -45,6 +45,11 @@ CURIOSITY_EVERY_N_INTERACTIONS = 6   # Dispara curiosidad cada N interacciones
 CURIOSITY_COOLDOWN_SECONDS = 300     # Cooldown mínimo entre ciclos
 CURIOSITY_MAX_PER_HOUR = 6           # Tope de ciclos por hora
 
+# ─── Razonamiento local (LLM) ───────────────────────────────
+LLM_DEADLINE_SECONDS = 15.0          # Espera máxima por una respuesta del LLM
+LLM_UNAVAILABLE_TTL_SECONDS = 30.0   # Tras un fallo, no reintentar durante N segundos
+LLM_AVAILABLE_TTL_SECONDS = 10.0     # Tras un sondeo correcto, no volver a sondear en N segundos
+
 # ─── Voz (KittenTTS Hugo) ───────────────────────────────────
 VOICE_ENABLED = True
 VOICE_COOLDOWN_SECONDS = 120
@@ -5,7 +5,12 @@ Selects low-confidence concepts and generates exploratory Q&A cycles.
 
 from __future__ import annotations
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Any, Optional
+
+import numpy as np
+
+from franquenstein.config import LLM_DEADLINE_SECONDS
 
 
 class CuriosityEngine:
@@ -14,14 +19,20 @@ class CuriosityEngine:
     def __init__(self, memory, reasoner):
         self.memory = memory
         self.reasoner = reasoner
+        self._pool: Optional[ThreadPoolExecutor] = None
 
     @staticmethod
-    def _curiosity_score(concept) -> float:
-        """Rank concepts by pedagogical value (v2 heuristic)."""
-        uncertainty = 1.0 - float(concept.confidence)
-        connectivity = len(concept.associations or []) * 0.2
-        reinforcement_bonus = min(0.4, float(concept.source_count) * 0.03)
-        return uncertainty + connectivity + reinforcement_bonus
+    def _curiosity_scores(concepts) -> np.ndarray:
+        """Rank concepts by pedagogical value (v2 heuristic), all at once."""
+        n = len(concepts)
+        confidence = np.fromiter((c.confidence for c in concepts), dtype=np.float64, count=n)
+        connectivity = np.fromiter(
+            (len(c.associations or ()) for c in concepts), dtype=np.float64, count=n
+        )
+        sources = np.fromiter((c.source_count for c in concepts), dtype=np.float64, count=n)
+        uncertainty = 1.0 - confidence
+        reinforcement_bonus = np.minimum(0.4, sources * 0.03)
+        return uncertainty + connectivity * 0.2 + reinforcement_bonus
 
     def explore_once(self, level_name: str = "Niño", mood: str = "curiosidad") -> dict[str, Any]:
         """Execute one curiosity step.
@@ -32,49 +43,73 @@ class CuriosityEngine:
         if not candidates:
             return {"status": "no_candidates", "question": "", "answer": ""}
 
-        concept = max(candidates, key=self._curiosity_score)
+        scores = self._curiosity_scores(candidates)
+        best = int(np.argmax(scores))
+        concept = candidates[best]
         question = f"¿Qué debería entender mejor sobre '{concept.concept}' y por qué importa?"
 
+        future = None
+        if self.reasoner:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="curiosity")
+            known = self.memory.semantic.get_known_concepts()
+            future = self._pool.submit(self._ask, question, level_name, mood, known)
+
+        # Prepared while the reasoner works; used if it has nothing to say
+        fallback = (
+            f"'{concept.concept}' parece importante porque se conecta con otras ideas. "
+            "Necesito más ejemplos para entenderlo mejor."
+        )
+
         answer = ""
-        if self.reasoner and self.reasoner.is_available():
+        if future is not None:
             try:
-                answer = self.reasoner.generate(
-                    input_text=question,
-                    level_name=level_name,
-                    mood=mood,
-                    working_memory=[],
-                    known_concepts=[c.concept for c in candidates],
-                    good_examples=None,
-                    user_name="",
-                )
+                answer = future.result(timeout=LLM_DEADLINE_SECONDS)
+            except FuturesTimeoutError:
+                future.cancel()
             except Exception:
-                answer = ""
+                pass
+        answer = answer or fallback
 
-        if not answer:
-            answer = (
-                f"'{concept.concept}' parece importante porque se conecta con otras ideas. "
-                "Necesito más ejemplos para entenderlo mejor."
+        # The episode and the concept update are committed together
+        with self.memory._conn:
+            self.memory.remember(
+                input_text=question,
+                output_text=answer,
+                emotion="curiosidad",
+                emotion_intensity=0.8,
+                feedback_score=0.3,
+                importance=0.6,
+                commit=False,
+            )
+            self.memory.semantic.record_exploration(
+                concept.concept, answer[:200], commit=False
             )
-
-        self.memory.remember(
-            input_text=question,
-            output_text=answer,
-            emotion="curiosidad",
-            emotion_intensity=0.8,
-            feedback_score=0.3,
-            importance=0.6,
-        )
-
-        self.memory.semantic.learn_concept(
-            concept=concept.concept,
-            definition=answer[:200],
-            initial_confidence=min(0.6, concept.confidence + 0.1),
-        )
 
         return {
             "status": "ok",
             "concept": concept.concept,
             "question": question,
             "answer": answer,
-            "score": round(self._curiosity_score(concept), 3),
+            "score": round(float(scores[best]), 3),
         }
+
+    def _ask(self, question: str, level_name: str, mood: str, known) -> str:
+        """Probe and query the reasoner (runs on the worker thread)."""
+        if not self.reasoner.is_available():
+            return ""
+        return self.reasoner.generate(
+            input_text=question,
+            level_name=level_name,
+            mood=mood,
+            working_memory=[],
+            known_concepts=known,
+            good_examples=None,
+            user_name="",
+        )
+
+    def close(self) -> None:
+        """Stop the worker thread, dropping any pending generation."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
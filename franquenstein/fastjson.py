@@ -0,0 +1,35 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson (de)serializes several times faster than the standard library.
+The hot paths (pattern values, the reflection log, episode contexts) go
+through these helpers and fall back to json when orjson is not available.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this catches both
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a compact JSON string."""
+        return orjson.dumps(obj).decode("utf-8")
+
+    loads = orjson.loads
+
+else:
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    loads = json.loads
@@ -7,14 +7,62 @@ that change how the being responds and reasons.
 
 from __future__ import annotations
 
-import json
 from typing import Optional
 
+import numpy as np
+
 from franquenstein.config import GROWTH_LEVELS
 from franquenstein.memory.memory import MemorySystem
 from franquenstein.growth.metrics import Metrics, MetricsSnapshot
 
 
+_CAPABILITIES_BY_LEVEL: dict[int, tuple[str, ...]] = {
+    0: (
+        "echo",           # Can repeat what it hears
+        "basic_response", # Can give simple responses
+    ),
+    1: (
+        "remember_name",     # Can remember the user's name
+        "recognize_keywords",# Can respond to known words
+        "show_emotion",      # Can express basic emotions
+    ),
+    2: (
+        "form_associations", # Can connect related concepts
+        "ask_questions",     # Can ask the user questions
+        "recall_memories",   # Can reference past interactions
+    ),
+    3: (
+        "basic_reasoning",      # Can make simple logical connections
+        "detect_contradictions", # Can notice inconsistencies
+        "express_preferences",   # Can state likes/dislikes
+    ),
+    4: (
+        "complex_reasoning",     # Can chain multiple ideas
+        "self_optimization",     # Can suggest improvements to itself
+        "teach_back",            # Can explain what it has learned
+    ),
+    5: (
+        "emergent",  # New capabilities based on learned patterns
+    ),
+}
+
+# Accumulated capabilities for each level (all levels up to and including it)
+_PREFIX_CAPS: tuple[tuple[str, ...], ...] = tuple(
+    tuple(
+        cap
+        for lvl in range(level + 1)
+        for cap in _CAPABILITIES_BY_LEVEL.get(lvl, ())
+    )
+    for level in range(max(max(GROWTH_LEVELS), max(_CAPABILITIES_BY_LEVEL)) + 1)
+)
+
+# Level thresholds, sorted by level, for vectorized level checks
+_SORTED_LEVELS = sorted(GROWTH_LEVELS.items())
+_LEVELS = np.array([level for level, _ in _SORTED_LEVELS])
+_VOCAB_NEEDED = np.array([req["vocab_needed"] for _, req in _SORTED_LEVELS])
+_EXPERIENCES_NEEDED = np.array([req["experiences_needed"] for _, req in _SORTED_LEVELS])
+
+
 class GrowthSystem:
     """Manages the being's growth from baby to sage.
 
@@ -27,21 +75,34 @@ class GrowthSystem:
         self._metrics = Metrics(memory)
         self._level = self._load_level()
         self._capabilities = self._get_capabilities_for_level(self._level)
+        self._capability_set = frozenset(self._capabilities)
+        self._status_prefix = self._build_status_prefix()
+        # ((level, memory change count), progress) of the last get_progress()
+        self._progress_cache: Optional[tuple[tuple[int, int], dict]] = None
 
     # ─── Growth Check ────────────────────────────────────────
 
-    def check_growth(self) -> Optional[dict]:
+    def snapshot(self) -> MetricsSnapshot:
+        """Current metrics, to share between growth checks in one turn."""
+        return self._metrics.snapshot()
+
+    def check_growth(self, snap: Optional[MetricsSnapshot] = None) -> Optional[dict]:
         """Check if the being should level up.
 
         Returns level-up info if a new level was reached, else None.
+        Pass a snapshot already taken this turn to avoid taking another.
         """
-        snap = self._metrics.snapshot()
+        if snap is None:
+            snap = self._metrics.snapshot()
         new_level = self._calculate_level(snap)
 
         if new_level > self._level:
             old_level = self._level
             self._level = new_level
             self._capabilities = self._get_capabilities_for_level(new_level)
+            self._capability_set = frozenset(self._capabilities)
+            self._status_prefix = self._build_status_prefix()
+            self._progress_cache = None
             self._save_level()
 
             return {
@@ -56,60 +117,22 @@ class GrowthSystem:
 
     def _calculate_level(self, snap: MetricsSnapshot) -> int:
         """Determine the appropriate level based on metrics."""
-        current_level = 0
-        for level, requirements in sorted(GROWTH_LEVELS.items()):
-            if (
-                snap.vocabulary_size >= requirements["vocab_needed"]
-                and snap.total_experiences >= requirements["experiences_needed"]
-            ):
-                current_level = level
-            else:
-                break
-        return current_level
+        met = (_VOCAB_NEEDED <= snap.vocabulary_size) & (
+            _EXPERIENCES_NEEDED <= snap.total_experiences
+        )
+        # Levels are earned in order: stop at the first unmet one
+        reached = int(np.cumprod(met).sum())
+        return int(_LEVELS[reached - 1]) if reached else 0
 
     # ─── Capabilities ────────────────────────────────────────
 
-    def _get_capabilities_for_level(self, level: int) -> list[str]:
+    def _get_capabilities_for_level(self, level: int) -> tuple[str, ...]:
         """Return the capabilities unlocked at a given level."""
-        capabilities_map = {
-            0: [
-                "echo",           # Can repeat what it hears
-                "basic_response", # Can give simple responses
-            ],
-            1: [
-                "remember_name",     # Can remember the user's name
-                "recognize_keywords",# Can respond to known words
-                "show_emotion",      # Can express basic emotions
-            ],
-            2: [
-                "form_associations", # Can connect related concepts
-                "ask_questions",     # Can ask the user questions
-                "recall_memories",   # Can reference past interactions
-            ],
-            3: [
-                "basic_reasoning",      # Can make simple logical connections
-                "detect_contradictions", # Can notice inconsistencies
-                "express_preferences",   # Can state likes/dislikes
-            ],
-            4: [
-                "complex_reasoning",     # Can chain multiple ideas
-                "self_optimization",     # Can suggest improvements to itself
-                "teach_back",            # Can explain what it has learned
-            ],
-            5: [
-                "emergent",  # New capabilities based on learned patterns
-            ],
-        }
-
-        # Accumulate capabilities from all levels up to current
-        all_caps: list[str] = []
-        for lvl in range(level + 1):
-            all_caps.extend(capabilities_map.get(lvl, []))
-        return all_caps
+        return _PREFIX_CAPS[min(level, len(_PREFIX_CAPS) - 1)]
 
     def can(self, capability: str) -> bool:
         """Check if the being has a specific capability."""
-        return capability in self._capabilities
+        return capability in self._capability_set
 
     # ─── State ───────────────────────────────────────────────
 
@@ -122,27 +145,38 @@ class GrowthSystem:
         return GROWTH_LEVELS.get(self._level, {}).get("name", "Unknown")
 
     @property
-    def capabilities(self) -> list[str]:
-        return list(self._capabilities)
+    def capabilities(self) -> tuple[str, ...]:
+        return self._capabilities
+
+    def get_progress(self, snap: Optional[MetricsSnapshot] = None) -> dict:
+        """Get progress towards the next level.
+
+        Cached until the level changes or memory is written to, since
+        the counts it reports cannot move otherwise.
+        """
+        key = (self._level, self._memory.change_count)
+        if self._progress_cache and self._progress_cache[0] == key:
+            return self._progress_cache[1]
 
-    def get_progress(self) -> dict:
-        """Get progress towards the next level."""
-        snap = self._metrics.snapshot()
         next_level = self._level + 1
 
         if next_level not in GROWTH_LEVELS:
-            return {
+            progress = {
                 "current_level": self._level,
                 "current_name": self.level_name,
                 "next_level": None,
                 "message": "Maximum level reached!",
             }
+            self._progress_cache = (key, progress)
+            return progress
 
+        if snap is None:
+            snap = self._metrics.snapshot()
         next_req = GROWTH_LEVELS[next_level]
         vocab_progress = snap.vocabulary_size / max(1, next_req["vocab_needed"])
         exp_progress = snap.total_experiences / max(1, next_req["experiences_needed"])
 
-        return {
+        progress = {
             "current_level": self._level,
             "current_name": self.level_name,
             "next_level": next_level,
@@ -152,21 +186,25 @@ class GrowthSystem:
             "vocab_progress": f"{min(100, vocab_progress * 100):.0f}%",
             "exp_progress": f"{min(100, exp_progress * 100):.0f}%",
         }
+        self._progress_cache = (key, progress)
+        return progress
 
-    def get_status_display(self) -> str:
+    def get_status_display(self, snap: Optional[MetricsSnapshot] = None) -> str:
         """Get a compact status string for the console UI."""
-        progress = self.get_progress()
-        return (
-            f"Lv.{self._level} {self.level_name} | "
-            f"Vocab: {progress.get('vocabulary', '?')} | "
-            f"Exp: {progress.get('experiences', '?')}"
+        progress = self.get_progress(snap)
+        return "%sVocab: %s | Exp: %s" % (
+            self._status_prefix,
+            progress.get("vocabulary", "?"),
+            progress.get("experiences", "?"),
         )
 
+    def _build_status_prefix(self) -> str:
+        return f"Lv.{self._level} {self.level_name} | "
+
     # ─── Persistence ─────────────────────────────────────────
 
     def _save_level(self) -> None:
         self._memory.save_state("growth_level", str(self._level))
-        self._memory.save_state("capabilities", json.dumps(self._capabilities))
 
     def _load_level(self) -> int:
         saved = self._memory.load_state("growth_level", "0")
@@ -8,11 +8,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 
 from franquenstein.memory.memory import MemorySystem
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MetricsSnapshot:
     """A snapshot of the being's performance at a point in time."""
 
@@ -35,30 +36,35 @@ class Metrics:
 
     def __init__(self, memory: MemorySystem):
         self._memory = memory
+        # Last snapshot, reused while nothing it measures has changed
+        self._last: Optional[tuple[tuple[int, int], MetricsSnapshot]] = None
 
     def snapshot(self) -> MetricsSnapshot:
-        """Take a snapshot of current performance metrics."""
+        """Take a snapshot of current performance metrics.
+
+        Back-to-back calls with no memory writes in between return the
+        same (immutable) snapshot.
+        """
+        key = (self._memory.change_count, self._memory.working.size)
+        if self._last and self._last[0] == key:
+            return self._last[1]
+
         stats = self._memory.get_stats()
         total_exp = stats["episodic_memories"]
         vocab = stats["semantic_concepts"]
 
         # Calculate averages from recent episodes
-        recent = self._memory.episodic.recall_recent(limit=50)
-        avg_feedback = 0.0
-        if recent:
-            scores = [e.feedback_score for e in recent]
-            avg_feedback = sum(scores) / len(scores)
+        scores = self._memory.episodic.recall_recent_feedback_array(limit=50)
+        avg_feedback = float(scores.mean()) if scores.size else 0.0
 
         # Learning efficiency: how many concepts per experience
         efficiency = vocab / max(1, total_exp)
 
         # Working memory utilization
-        wm_parts = stats["working_memory"].split("/")
-        wm_used = int(wm_parts[0]) if len(wm_parts) == 2 else 0
-        wm_total = int(wm_parts[1]) if len(wm_parts) == 2 else 1
-        utilization = wm_used / max(1, wm_total)
+        working = self._memory.working
+        utilization = working.size / max(1, working.capacity)
 
-        return MetricsSnapshot(
+        snap = MetricsSnapshot(
             timestamp=datetime.now().isoformat(),
             total_experiences=total_exp,
             vocabulary_size=vocab,
@@ -68,6 +74,8 @@ class Metrics:
             learning_efficiency=round(efficiency, 3),
             memory_utilization=round(utilization, 2),
         )
+        self._last = (key, snap)
+        return snap
 
     def get_development_summary(self) -> dict:
         """Get a human-readable development summary."""
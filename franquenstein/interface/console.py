@@ -14,6 +14,7 @@ from rich.theme import Theme
 from rich.live import Live
 from rich.columns import Columns
 from rich import box
+from rich.markup import escape
 
 from franquenstein.config import BEING_NAME
 
@@ -50,6 +51,37 @@ EMOTION_ICONS = {
     "aburrimiento": "😑",
 }
 
+# emotion -> theme style name, for the emotions the theme knows about
+_EMOTION_STYLES = {
+    name.split(".", 1)[1]: name
+    for name in FRANQUENSTEIN_THEME.styles
+    if name.startswith("emotion.")
+}
+
+
+# Static parts of the startup banner, parsed once
+_BANNER_HEAD = Text.from_markup(
+    "[being]╔══════════════════════════════════════════╗\n║  [/]"
+    f"[bold bright_cyan]🧠  {escape(BEING_NAME)}[/]"
+    "[dim cyan]  — Digital Being[/]"
+    "[being]        ║\n╠══════════════════════════════════════════╣\n[/]"
+)
+_BANNER_FOOT = Text("╚══════════════════════════════════════════╝\n", style="being")
+
+_HELP_COMMANDS = (
+    ("/stats", "Show full statistics"),
+    ("/memory", "Show memory contents"),
+    ("/level", "Show growth progress"),
+    ("/reflect", "Trigger a reflection session"),
+    ("/learn <path_or_url>", "Learn from .txt/.md/.pdf or web URL"),
+    ("/curious", "Run one proactive curiosity cycle"),
+    ("/brain", "Show neural graph stats"),
+    ("/chem", "Show neurochemical state"),
+    ("/inner", "Show recent inner thoughts"),
+    ("/help", "Show this help"),
+    ("/quit", "Save and exit"),
+)
+
 
 class ConsoleInterface:
     """Rich terminal interface for Franquenstein.
@@ -64,6 +96,21 @@ class ConsoleInterface:
     def __init__(self):
         self.console = Console(theme=FRANQUENSTEIN_THEME)
         self._show_welcome = True
+        self._help_table = self._build_help_table()
+
+    @staticmethod
+    def _build_help_table() -> Table:
+        """The /help table never changes, so it is built once and reused."""
+        table = Table(
+            title="Available Commands",
+            box=box.SIMPLE,
+            border_style="cyan",
+        )
+        table.add_column("Command", style="bold cyan")
+        table.add_column("Description", style="white")
+        for cmd, desc in _HELP_COMMANDS:
+            table.add_row(cmd, desc)
+        return table
 
     # ─── Display Methods ─────────────────────────────────────
 
@@ -71,19 +118,13 @@ class ConsoleInterface:
         """Show the startup banner."""
         emotion_icon = EMOTION_ICONS.get(mood, "😐")
 
-        banner = Text()
-        banner.append("╔══════════════════════════════════════════╗\n", style="being")
-        banner.append("║  ", style="being")
-        banner.append(f"🧠  {BEING_NAME}", style="bold bright_cyan")
-        banner.append("  — Digital Being", style="dim cyan")
-        banner.append("        ║\n", style="being")
-        banner.append("╠══════════════════════════════════════════╣\n", style="being")
-        banner.append(f"║  Level: ", style="being")
+        banner = _BANNER_HEAD.copy()
+        banner.append("║  Level: ", style="being")
         banner.append(f"{level} ({level_name})", style="level")
-        banner.append(f"   Mood: {emotion_icon} {mood}", style=f"emotion.{mood}")
+        banner.append(f"   Mood: {emotion_icon} {mood}", style=_EMOTION_STYLES.get(mood, "white"))
         spaces = 42 - len(f"  Level: {level} ({level_name})   Mood: {emotion_icon} {mood}")
         banner.append(" " * max(0, spaces) + "║\n", style="being")
-        banner.append("╚══════════════════════════════════════════╝\n", style="being")
+        banner.append_text(_BANNER_FOOT)
 
         self.console.print(banner)
 
@@ -100,7 +141,7 @@ class ConsoleInterface:
     def show_response(self, text: str, emotion: str = "neutral") -> None:
         """Display the being's response with emotion indicator."""
         icon = EMOTION_ICONS.get(emotion, "😐")
-        style = f"emotion.{emotion}" if f"emotion.{emotion}" in FRANQUENSTEIN_THEME.styles else "white"
+        style = _EMOTION_STYLES.get(emotion, "white")
 
         self.console.print(
             f"  {icon} [being]{BEING_NAME}:[/] [{style}]{text}[/{style}]"
@@ -178,35 +219,34 @@ class ConsoleInterface:
 
     def show_memory(self, recent_episodes: list, known_concepts: list) -> None:
         """Show memory contents."""
-        self.console.print()
-        self.console.print("[bold cyan]🧠 Memory Contents[/]")
-        self.console.print()
+        lines = ["", "[bold cyan]🧠 Memory Contents[/]", ""]
 
         # Recent episodes
         if recent_episodes:
-            self.console.print("[bold]Recent Memories:[/]")
-            for ep in recent_episodes[:5]:
-                icon = EMOTION_ICONS.get(ep.emotion, "😐")
-                self.console.print(
-                    f"  {icon} [{ep.timestamp[:16]}] "
-                    f"[dim]\"{ep.input_text[:40]}\"[/] → "
-                    f"[dim]\"{ep.output_text[:40]}\"[/]"
-                )
+            lines.append("[bold]Recent Memories:[/]")
+            lines.extend(
+                f"  {EMOTION_ICONS.get(ep.emotion, '😐')} [{ep.timestamp[:16]}] "
+                f"[dim]\"{ep.input_text[:40]}\"[/] → "
+                f"[dim]\"{ep.output_text[:40]}\"[/]"
+                for ep in recent_episodes[:5]
+            )
         else:
-            self.console.print("  [dim]No memories yet.[/]")
+            lines.append("  [dim]No memories yet.[/]")
 
-        self.console.print()
+        lines.append("")
 
         # Known concepts
         if known_concepts:
-            self.console.print("[bold]Known Concepts:[/]")
+            lines.append("[bold]Known Concepts:[/]")
             concept_texts = [
                 f"[cyan]{c.concept}[/] ({c.confidence:.0%})"
                 for c in known_concepts[:15]
             ]
-            self.console.print(f"  {', '.join(concept_texts)}")
+            lines.append(f"  {', '.join(concept_texts)}")
         else:
-            self.console.print("  [dim]No concepts learned yet.[/]")
+            lines.append("  [dim]No concepts learned yet.[/]")
+
+        self.console.print("\n".join(lines))
 
     def show_progress(self, progress: dict) -> None:
         """Show growth progress towards next level."""
@@ -237,31 +277,7 @@ class ConsoleInterface:
     def show_help(self) -> None:
         """Show available commands."""
         self.console.print()
-        table = Table(
-            title="Available Commands",
-            box=box.SIMPLE,
-            border_style="cyan",
-        )
-        table.add_column("Command", style="bold cyan")
-        table.add_column("Description", style="white")
-
-        commands = [
-            ("/stats", "Show full statistics"),
-            ("/memory", "Show memory contents"),
-            ("/level", "Show growth progress"),
-            ("/reflect", "Trigger a reflection session"),
-            ("/learn <path_or_url>", "Learn from .txt/.md/.pdf or web URL"),
-            ("/curious", "Run one proactive curiosity cycle"),
-            ("/brain", "Show neural graph stats"),
-            ("/chem", "Show neurochemical state"),
-            ("/inner", "Show recent inner thoughts"),
-            ("/help", "Show this help"),
-            ("/quit", "Save and exit"),
-        ]
-        for cmd, desc in commands:
-            table.add_row(cmd, desc)
-
-        self.console.print(table)
+        self.console.print(self._help_table)
 
     def show_reflection(self, reflections: list) -> None:
         """Show reflection results."""
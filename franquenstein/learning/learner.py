@@ -6,7 +6,9 @@ into a unified learning loop. Every interaction feeds through here.
 
 from __future__ import annotations
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Mapping
+from typing import Any, Callable, Iterator, Optional
 
 from franquenstein.memory.memory import MemorySystem
 from franquenstein.learning.patterns import PatternDetector
@@ -17,6 +19,25 @@ from franquenstein.config import (
 )
 
 
+class _LazyKnowledge(Mapping):
+    """Read-only mapping that computes each value on first access."""
+
+    def __init__(self, producers: dict[str, Callable[[], Any]]):
+        self._producers = producers
+        self._values: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._values:
+            self._values[key] = self._producers[key]()
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._producers)
+
+    def __len__(self) -> int:
+        return len(self._producers)
+
+
 class Learner:
     """The being's learning engine.
 
@@ -31,7 +52,11 @@ class Learner:
 
     def __init__(self, memory: MemorySystem):
         self._memory = memory
-        self._patterns = PatternDetector(memory._conn)
+        # Pattern tracking has its own connection and worker thread so it
+        # can run alongside the memory writes of each interaction.
+        self._patterns_conn = memory.open_connection()
+        self._patterns = PatternDetector(self._patterns_conn)
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="learner-io")
         self._metacognition = MetaCognition(memory)
         self._interaction_count = 0
         self._session_feedback: list[float] = []
@@ -53,8 +78,8 @@ class Learner:
         """
         self._interaction_count += 1
 
-        # 1. Observe patterns in the input
-        new_patterns = self._patterns.observe(input_text)
+        # 1. Observe patterns in the input (in the background)
+        patterns_future = self._io_pool.submit(self._patterns.observe, input_text)
 
         # 2. Store in memory
         episode_id = self._memory.remember(
@@ -66,11 +91,10 @@ class Learner:
 
         # 3. Learn words as semantic concepts
         words = self._memory._extract_key_words(input_text)
-        for word in words:
-            self._memory.semantic.learn_concept(
-                concept=word,
-                definition="",  # Will be enriched over time
-            )
+        # Definitions will be enriched over time
+        self._memory.semantic.learn_concepts_bulk(words)
+
+        new_patterns = patterns_future.result()
 
         # 4. Periodically consolidate and reflect
         consolidation_result = None
@@ -114,8 +138,7 @@ class Learner:
         # Adjust emotional memory
         words = self._memory._extract_key_words(input_text) if input_text else []
         emotion = "satisfaccion" if score > 0 else "frustracion"
-        for word in words:
-            self._memory.emotional.feel(word, emotion, abs(score))
+        self._memory.emotional.feel_many(words, emotion, abs(score))
 
         # Metacognitive evaluation
         return self._metacognition.evaluate_interaction(episode_id, score)
@@ -130,40 +153,39 @@ class Learner:
         """
         return self._patterns.get_best_response(input_text)
 
-    def get_relevant_knowledge(self, input_text: str) -> dict:
+    def get_relevant_knowledge(self, input_text: str) -> Mapping[str, Any]:
         """Gather all relevant knowledge for formulating a response.
 
         Searches across memory layers and patterns for anything
-        related to the input.
+        related to the input. Each field is only looked up the first
+        time it is read, so callers pay for what they use. The episodic
+        search is the exception: it runs right away, because recalling
+        an episode refreshes its access bookkeeping, which decay() uses.
         """
-        # Search memory
-        memories = self._memory.recall(input_text)
-
-        # Get known words in the input
         words = self._memory._extract_key_words(input_text)
-        known_concepts = []
-        for word in words:
-            concept = self._memory.semantic.get_concept(word)
-            if concept and concept.confidence > 0.2:
-                known_concepts.append(concept)
-
-        # Get emotional associations
-        emotions_about = {}
-        for word in words:
-            dominant = self._memory.emotional.get_dominant_emotion(word)
-            if dominant:
-                emotions_about[word] = dominant.emotion
-
-        # Get recent reflections
-        reflections = self._metacognition.get_recent_reflections(3)
-
-        return {
-            "working_context": memories["working"],
-            "related_episodes": memories["episodic"][:3],
+        memory = self._memory
+        related_episodes = memory.episodic.search(input_text, limit=3)
+
+        def known_concepts() -> list:
+            return [
+                concept
+                for concept in memory.semantic.get_concepts_by_names(words)
+                if concept.confidence > 0.2
+            ]
+
+        def emotions_about() -> dict[str, str]:
+            dominant = memory.emotional.get_dominant_emotions(words)
+            return {w: dominant[w].emotion for w in words if w in dominant}
+
+        return _LazyKnowledge({
+            "working_context": lambda: memory.working.search(input_text),
+            "related_episodes": lambda: related_episodes,
             "known_concepts": known_concepts,
             "emotions_about": emotions_about,
-            "recent_reflections": [r.insight for r in reflections],
-        }
+            "recent_reflections": lambda: [
+                r.insight for r in self._metacognition.get_recent_reflections(3)
+            ],
+        })
 
     # ─── Statistics ──────────────────────────────────────────
 
@@ -174,15 +196,21 @@ class Learner:
             if self._session_feedback
             else 0.0
         )
+        total_reflections, strengths, weaknesses = self._metacognition.count_reflections()
         return {
             "interactions_this_session": self._interaction_count,
             "known_words": self._patterns.get_word_count(),
             "session_avg_feedback": round(avg_feedback, 2),
-            "total_reflections": len(self._metacognition.get_recent_reflections(100)),
-            "strengths": len(self._metacognition.get_strengths()),
-            "weaknesses": len(self._metacognition.get_weaknesses()),
+            "total_reflections": total_reflections,
+            "strengths": strengths,
+            "weaknesses": weaknesses,
         }
 
+    def close(self) -> None:
+        """Stop the I/O worker and close the pattern connection."""
+        self._io_pool.shutdown(wait=True)
+        self._patterns_conn.close()
+
     @property
     def patterns(self) -> PatternDetector:
         return self._patterns
@@ -7,16 +7,21 @@ and generates insights that improve future reasoning.
 
 from __future__ import annotations
 
-import json
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from franquenstein import fastjson
 from franquenstein.memory.episodic import EpisodicMemory, Episode
 from franquenstein.memory.memory import MemorySystem
 
+# Reflections kept across restarts, and the log size that triggers compaction
+_KEEP_REFLECTIONS = 50
+_COMPACT_REFLECTIONS = 200
 
-@dataclass
+
+@dataclass(slots=True)
 class Reflection:
     """A self-reflection by the being."""
 
@@ -38,6 +43,9 @@ class MetaCognition:
     def __init__(self, memory: MemorySystem):
         self._memory = memory
         self._reflections: list[Reflection] = []
+        # Same reflections grouped by category, kept in step with _reflections
+        self._by_category: defaultdict[str, list[Reflection]] = defaultdict(list)
+        self._log_lines = 0  # Lines currently in the persisted log
         self._load_reflections()
 
     # ─── Self-Evaluation ─────────────────────────────────────
@@ -70,43 +78,50 @@ class MetaCognition:
         Reviews the last N interactions and generates insights.
         This is like "sleeping" — processing the day's experiences.
         """
-        episodes = self._memory.episodic.recall_recent(limit=n_recent)
-        if not episodes:
+        # Analyze feedback distribution and emotions in one pass
+        positive_ids: list[int] = []
+        negative_ids: list[int] = []
+        positive = negative = 0
+        emotion_counts: Counter[str] = Counter()
+        for episode_id, feedback_score, emotion in self._memory.episodic.recall_recent_rows(
+            limit=n_recent
+        ):
+            emotion_counts[emotion] += 1
+            if feedback_score > 0.3:
+                positive += 1
+                if episode_id:
+                    positive_ids.append(episode_id)
+            elif feedback_score < -0.3:
+                negative += 1
+                if episode_id:
+                    negative_ids.append(episode_id)
+        if not emotion_counts:
             return []
 
         new_reflections: list[Reflection] = []
 
-        # Analyze feedback distribution
-        positive = [e for e in episodes if e.feedback_score > 0.3]
-        negative = [e for e in episodes if e.feedback_score < -0.3]
-        neutral = [e for e in episodes if -0.3 <= e.feedback_score <= 0.3]
-
         # Insight: What types of responses work well?
-        if len(positive) > len(negative) * 2:
+        if positive > negative * 2:
             r = Reflection(
                 timestamp=datetime.now().isoformat(),
                 insight="Most recent interactions were positive. Current approach is working well.",
                 category="strength",
                 confidence=0.7,
-                source_episodes=[e.id for e in positive if e.id],
+                source_episodes=positive_ids,
             )
             new_reflections.append(r)
-        elif len(negative) > len(positive):
+        elif negative > positive:
             r = Reflection(
                 timestamp=datetime.now().isoformat(),
                 insight="More negative than positive interactions recently. Need to adjust approach.",
                 category="weakness",
                 confidence=0.7,
-                source_episodes=[e.id for e in negative if e.id],
+                source_episodes=negative_ids,
             )
             new_reflections.append(r)
 
         # Insight: Emotional patterns
-        emotion_counts: dict[str, int] = {}
-        for e in episodes:
-            emotion_counts[e.emotion] = emotion_counts.get(e.emotion, 0) + 1
-
-        dominant_emotion = max(emotion_counts, key=emotion_counts.get) if emotion_counts else "neutral"
+        dominant_emotion = emotion_counts.most_common(1)[0][0] if emotion_counts else "neutral"
         if dominant_emotion != "neutral":
             r = Reflection(
                 timestamp=datetime.now().isoformat(),
@@ -134,8 +149,8 @@ class MetaCognition:
 
         # Store reflections
         for ref in new_reflections:
-            self._reflections.append(ref)
-        self._save_reflections()
+            self._add_reflection(ref)
+        self._save_reflections(new_reflections)
 
         return new_reflections
 
@@ -145,11 +160,22 @@ class MetaCognition:
 
     def get_strengths(self) -> list[Reflection]:
         """Get identified strengths."""
-        return [r for r in self._reflections if r.category == "strength"]
+        return list(self._by_category["strength"])
 
     def get_weaknesses(self) -> list[Reflection]:
         """Get identified weaknesses."""
-        return [r for r in self._reflections if r.category == "weakness"]
+        return list(self._by_category["weakness"])
+
+    def count_reflections(self, recent_limit: int = 100) -> tuple[int, int, int]:
+        """Count reflections without building intermediate lists.
+
+        Returns (recent total capped at recent_limit, strengths, weaknesses).
+        """
+        return (
+            min(len(self._reflections), recent_limit),
+            len(self._by_category["strength"]),
+            len(self._by_category["weakness"]),
+        )
 
     # ─── Internal ────────────────────────────────────────────
 
@@ -181,40 +207,84 @@ class MetaCognition:
             confidence=min(1.0, abs(feedback_score)),
             source_episodes=[episode.id] if episode.id else [],
         )
-        self._reflections.append(r)
-        self._save_reflections()
+        self._add_reflection(r)
+        self._save_reflections([r])
         return r
 
-    def _save_reflections(self) -> None:
-        """Persist reflections to the being's state."""
-        # Keep only last 50 reflections to avoid unbounded growth
-        trimmed = self._reflections[-50:]
-        data = json.dumps([
-            {
-                "timestamp": r.timestamp,
-                "insight": r.insight,
-                "category": r.category,
-                "confidence": r.confidence,
-                "source_episodes": r.source_episodes,
-            }
-            for r in trimmed
-        ])
-        self._memory.save_state("reflections", data)
+    def _add_reflection(self, reflection: Reflection) -> None:
+        """Record a reflection in the list and its category index."""
+        self._reflections.append(reflection)
+        self._by_category[reflection.category].append(reflection)
+
+    def _save_reflections(self, new: list[Reflection]) -> None:
+        """Append new reflections to the persisted JSON-lines log.
+
+        The log is compacted back to the last _KEEP_REFLECTIONS entries
+        once it grows past _COMPACT_REFLECTIONS lines.
+        """
+        if not new:
+            return
+        self._memory.append_state(
+            "reflections_log", "".join(self._to_json_line(r) for r in new)
+        )
+        self._log_lines += len(new)
+        if self._log_lines > _COMPACT_REFLECTIONS:
+            self._compact_reflections()
+
+    def _compact_reflections(self) -> None:
+        """Rewrite the log with only the most recent reflections."""
+        kept = self._reflections[-_KEEP_REFLECTIONS:]
+        self._memory.save_state(
+            "reflections_log", "".join(self._to_json_line(r) for r in kept)
+        )
+        self._log_lines = len(kept)
 
     def _load_reflections(self) -> None:
         """Load saved reflections from persistent state."""
-        data = self._memory.load_state("reflections", "[]")
-        try:
-            items = json.loads(data)
-            self._reflections = [
-                Reflection(
+        data = self._memory.load_state("reflections_log")
+        if data:
+            # Only the tail is kept; older lines are compacted away below
+            lines = data.rsplit("\n", _KEEP_REFLECTIONS + 1)[-_KEEP_REFLECTIONS - 1:]
+            self._log_lines = data.count("\n")
+        else:
+            # Older saves stored a single JSON array under "reflections"
+            try:
+                lines = [fastjson.dumps(item) for item in fastjson.loads(
+                    self._memory.load_state("reflections", "[]")
+                )]
+            except fastjson.JSONDecodeError:
+                lines = []
+            self._log_lines = -1  # Force writing the log below
+
+        self._reflections = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                item = fastjson.loads(line)
+                self._reflections.append(Reflection(
                     timestamp=item["timestamp"],
                     insight=item["insight"],
                     category=item["category"],
                     confidence=item["confidence"],
                     source_episodes=item.get("source_episodes", []),
-                )
-                for item in items
-            ]
-        except (json.JSONDecodeError, KeyError):
-            self._reflections = []
+                ))
+            except (fastjson.JSONDecodeError, KeyError, TypeError):
+                continue
+        self._reflections = self._reflections[-_KEEP_REFLECTIONS:]
+        self._by_category.clear()
+        for r in self._reflections:
+            self._by_category[r.category].append(r)
+
+        if self._log_lines != len(self._reflections):
+            self._compact_reflections()
+
+    @staticmethod
+    def _to_json_line(r: Reflection) -> str:
+        return fastjson.dumps({
+            "timestamp": r.timestamp,
+            "insight": r.insight,
+            "category": r.category,
+            "confidence": r.confidence,
+            "source_episodes": r.source_episodes,
+        }) + "\n"
@@ -7,14 +7,38 @@ frameworks — just statistics and smart counting.
 
 from __future__ import annotations
 
-import json
 import sqlite3
-from collections import Counter
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
 from typing import Optional
 
+from franquenstein import fastjson
 
-@dataclass
+# Punctuation trimmed from both ends of every token
+_TOKEN_PUNCT = ".,!?¿¡;:\"'()[]{}—–-"
+
+# Best responses kept in the in-memory lookup cache
+_BEST_RESPONSE_CACHE_SIZE = 1024
+
+# Candidate outputs kept per input, and their ranking (best first)
+_MAX_RESPONSE_VARIANTS = 5
+_VARIANT_RANK = "ROUND(score, 3) DESC, count DESC, rowid"
+
+# Maximum keys per IN (...) query
+_MAX_SQL_PARAMS = 900
+
+# Add n sightings to a pattern; a pattern seen once keeps the base confidence
+_BUMP_PATTERN_SQL = """
+    INSERT INTO patterns (pattern_type, pattern_key, pattern_value, frequency, confidence)
+    VALUES (?1, ?2, '{}', ?3, CASE WHEN ?3 > 1 THEN MIN(1.0, 0.1 + ?3 * 0.05) ELSE 0.1 END)
+    ON CONFLICT(pattern_type, pattern_key) DO UPDATE SET
+        frequency = frequency + excluded.frequency,
+        confidence = MIN(1.0, 0.1 + (frequency + excluded.frequency) * 0.05),
+        last_seen = datetime('now')
+"""
+
+
+@dataclass(slots=True)
 class Pattern:
     """A detected pattern."""
 
@@ -40,6 +64,10 @@ class PatternDetector:
 
     def __init__(self, db_connection: sqlite3.Connection):
         self._conn = db_connection
+        # Normalized input → best response (or None), LRU-ordered.
+        # observe_response drops the entry of the input it updates.
+        self._best: OrderedDict[str, Optional[str]] = OrderedDict()
+        self._migrate_response_variants()
 
     # ─── Observe & Detect ────────────────────────────────────
 
@@ -50,20 +78,24 @@ class PatternDetector:
         the confidence threshold for the first time).
         """
         words = self._tokenize(text)
+        counts = {
+            "word_freq": Counter(words),
+            "bigram": Counter(map("_".join, zip(words, words[1:]))),
+        }
+
+        with self._conn:
+            for pattern_type, counter in counts.items():
+                self._conn.executemany(
+                    _BUMP_PATTERN_SQL,
+                    [(pattern_type, key, n) for key, n in counter.items()],
+                )
+
+        # A pattern becomes "known" when its frequency reaches 3
         new_patterns: list[Pattern] = []
-
-        # Track word frequencies
-        for word in words:
-            pattern = self._record_pattern("word_freq", word)
-            if pattern and pattern.frequency == 3:  # First time becoming "known"
-                new_patterns.append(pattern)
-
-        # Track bigrams (word pairs)
-        for i in range(len(words) - 1):
-            bigram = f"{words[i]}_{words[i+1]}"
-            pattern = self._record_pattern("bigram", bigram)
-            if pattern and pattern.frequency == 3:
-                new_patterns.append(pattern)
+        for pattern_type, counter in counts.items():
+            for pattern in self._get_patterns(pattern_type, counter):
+                if pattern.frequency - counter[pattern.pattern_key] < 3 <= pattern.frequency:
+                    new_patterns.append(pattern)
 
         return new_patterns
 
@@ -76,60 +108,50 @@ class PatternDetector:
         """Track an input→output pair with its effectiveness.
 
         If feedback is positive, the response pattern strengthens.
-        If negative, it weakens.
+        If negative, it weakens. Each candidate output is a row in
+        response_variants, so only that row is updated.
         """
         key = self._normalize(input_text)
-        existing = self._get_pattern("response_pattern", key)
-
-        if existing:
-            # Update existing response pattern
-            value = existing.pattern_value
-            responses = value.get("responses", [])
-
-            # Add or update this response
-            found = False
-            for resp in responses:
-                if resp["output"] == output_text:
-                    resp["score"] = (resp["score"] * 0.7) + (feedback_score * 0.3)
-                    resp["count"] += 1
-                    found = True
-                    break
-
-            if not found:
-                responses.append({
-                    "output": output_text,
-                    "score": feedback_score,
-                    "count": 1,
-                })
-
-            # Sort by score + repeat count (prefer stable responses)
-            responses.sort(
-                key=lambda r: (round(float(r["score"]), 3), int(r.get("count", 0))),
-                reverse=True,
-            )
-            value["responses"] = responses[:5]  # Keep top 5
-
-            self._update_pattern(
-                "response_pattern",
-                key,
-                value,
-                confidence=max(r["score"] for r in responses) if responses else 0.1,
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO response_variants (pattern_key, output, score)
+                VALUES (?, ?, ?)
+                ON CONFLICT(pattern_key, output) DO UPDATE SET
+                    score = score * 0.7 + excluded.score * 0.3,
+                    count = count + 1
+                """,
+                (key, output_text, feedback_score),
             )
-            return self._get_pattern("response_pattern", key)
-        else:
-            # New response pattern
-            value = {
-                "responses": [{
-                    "output": output_text,
-                    "score": feedback_score,
-                    "count": 1,
-                }]
-            }
-            return self._record_pattern(
-                "response_pattern",
-                key,
-                value,
+            # Keep the top 5 (prefer stable, well-scored responses)
+            self._conn.execute(
+                f"""
+                DELETE FROM response_variants
+                WHERE pattern_key = ?1 AND rowid NOT IN (
+                    SELECT rowid FROM response_variants
+                    WHERE pattern_key = ?1
+                    ORDER BY {_VARIANT_RANK}
+                    LIMIT {_MAX_RESPONSE_VARIANTS}
+                )
+                """,
+                (key,),
             )
+            row = self._conn.execute(
+                """
+                INSERT INTO patterns (pattern_type, pattern_key, pattern_value)
+                VALUES ('response_pattern', ?1, '{}')
+                ON CONFLICT(pattern_type, pattern_key) DO UPDATE SET
+                    frequency = frequency + 1,
+                    confidence = (
+                        SELECT MAX(score) FROM response_variants WHERE pattern_key = ?1
+                    ),
+                    last_seen = datetime('now')
+                RETURNING *
+                """,
+                (key,),
+            ).fetchone()
+        self._best.pop(key, None)
+        return self._row_to_pattern(row) if row else None
 
     # ─── Query ───────────────────────────────────────────────
 
@@ -137,35 +159,35 @@ class PatternDetector:
         """Get the best known response for an input (if any).
 
         Returns the highest-scored response pattern, or None
-        if no good pattern exists.
+        if no good pattern exists. Answers are cached until the
+        input receives new feedback.
         """
         key = self._normalize(input_text)
-        pattern = self._get_pattern("response_pattern", key)
-
-        if not pattern:
-            return None
-
-        responses = pattern.pattern_value.get("responses", [])
-        if not responses:
-            return None
+        if key in self._best:
+            self._best.move_to_end(key)
+            return self._best[key]
 
         # Prefer stable responses (count>=2) with positive score.
-        stable = [
-            r for r in responses
-            if float(r.get("score", 0.0)) > 0.0 and int(r.get("count", 0)) >= 2
-        ]
-        if stable:
-            stable.sort(
-                key=lambda r: (round(float(r["score"]), 3), int(r.get("count", 0))),
-                reverse=True,
-            )
-            return stable[0]["output"]
+        row = self._conn.execute(
+            f"""
+            SELECT output, score, count >= 2 AND score > 0.0 AS stable
+            FROM response_variants
+            WHERE pattern_key = ?
+            ORDER BY stable DESC, {_VARIANT_RANK}
+            LIMIT 1
+            """,
+            (key,),
+        ).fetchone()
 
+        best = None
         # Fallback: allow high-confidence single-shot answers only if very strong.
-        best = responses[0]
-        if float(best.get("score", 0.0)) >= 0.9:
-            return best["output"]
-        return None
+        if row and (row[2] or row[1] >= 0.9):
+            best = row[0]
+
+        self._best[key] = best
+        if len(self._best) > _BEST_RESPONSE_CACHE_SIZE:
+            self._best.popitem(last=False)
+        return best
 
     def get_known_words(self, min_frequency: int = 3) -> list[tuple[str, int]]:
         """Get words the being 'knows' (has seen multiple times)."""
@@ -177,7 +199,7 @@ class PatternDetector:
             """,
             (min_frequency,),
         ).fetchall()
-        return [(row[0], row[1]) for row in rows]
+        return rows  # Already (key, frequency) tuples
 
     def get_top_patterns(
         self,
@@ -205,84 +227,67 @@ class PatternDetector:
 
     # ─── Internal ────────────────────────────────────────────
 
-    def _record_pattern(
-        self,
-        pattern_type: str,
-        pattern_key: str,
-        pattern_value: Optional[dict] = None,
-    ) -> Optional[Pattern]:
-        """Record or increment a pattern."""
-        existing = self._get_pattern(pattern_type, pattern_key)
+    def _get_patterns(self, pattern_type: str, pattern_keys) -> list[Pattern]:
+        """Retrieve several patterns of one type, in the order of pattern_keys."""
+        keys = list(pattern_keys)
+        found: dict[str, Pattern] = {}
+        for start in range(0, len(keys), _MAX_SQL_PARAMS):
+            chunk = keys[start:start + _MAX_SQL_PARAMS]
+            rows = self._conn.execute(
+                f"""
+                SELECT * FROM patterns
+                WHERE pattern_type = ? AND pattern_key IN ({",".join("?" * len(chunk))})
+                """,
+                (pattern_type, *chunk),
+            ).fetchall()
+            for row in rows:
+                found[row[2]] = self._row_to_pattern(row)
+        return [found[key] for key in keys if key in found]
+
+    def _migrate_response_variants(self) -> None:
+        """Move responses stored as JSON by older versions into response_variants."""
+        rows = self._conn.execute(
+            """
+            SELECT pattern_key, pattern_value FROM patterns
+            WHERE pattern_type = 'response_pattern' AND pattern_value LIKE '%"responses"%'
+            """
+        ).fetchall()
+        if not rows:
+            return
+
+        variants = []
+        for key, value in rows:
+            try:
+                responses = fastjson.loads(value).get("responses", [])
+            except (fastjson.JSONDecodeError, AttributeError):
+                continue
+            variants.extend(
+                (key, r["output"], float(r.get("score", 0.0)), int(r.get("count", 1)))
+                for r in responses
+                if "output" in r
+            )
 
-        if existing:
-            new_freq = existing.frequency + 1
-            new_conf = min(1.0, 0.1 + (new_freq * 0.05))
-            self._conn.execute(
+        with self._conn:
+            self._conn.executemany(
                 """
-                UPDATE patterns
-                SET frequency = ?, confidence = ?, last_seen = datetime('now')
-                WHERE pattern_type = ? AND pattern_key = ?
+                INSERT OR IGNORE INTO response_variants (pattern_key, output, score, count)
+                VALUES (?, ?, ?, ?)
                 """,
-                (new_freq, new_conf, pattern_type, pattern_key),
+                variants,
             )
-            self._conn.commit()
-            existing.frequency = new_freq
-            existing.confidence = new_conf
-            return existing
-        else:
-            value_json = json.dumps(pattern_value or {})
             self._conn.execute(
                 """
-                INSERT INTO patterns (pattern_type, pattern_key, pattern_value)
-                VALUES (?, ?, ?)
-                """,
-                (pattern_type, pattern_key, value_json),
+                UPDATE patterns SET pattern_value = '{}'
+                WHERE pattern_type = 'response_pattern' AND pattern_value LIKE '%"responses"%'
+                """
             )
-            self._conn.commit()
-            return self._get_pattern(pattern_type, pattern_key)
-
-    def _update_pattern(
-        self,
-        pattern_type: str,
-        pattern_key: str,
-        pattern_value: dict,
-        confidence: float = 0.1,
-    ) -> None:
-        """Update an existing pattern's value and confidence."""
-        self._conn.execute(
-            """
-            UPDATE patterns
-            SET pattern_value = ?, confidence = ?,
-                frequency = frequency + 1, last_seen = datetime('now')
-            WHERE pattern_type = ? AND pattern_key = ?
-            """,
-            (json.dumps(pattern_value), confidence, pattern_type, pattern_key),
-        )
-        self._conn.commit()
-
-    def _get_pattern(self, pattern_type: str, pattern_key: str) -> Optional[Pattern]:
-        """Retrieve a specific pattern."""
-        row = self._conn.execute(
-            """
-            SELECT * FROM patterns
-            WHERE pattern_type = ? AND pattern_key = ?
-            """,
-            (pattern_type, pattern_key),
-        ).fetchone()
-        return self._row_to_pattern(row) if row else None
 
     # ─── Helpers ─────────────────────────────────────────────
 
     @staticmethod
     def _tokenize(text: str) -> list[str]:
         """Simple tokenizer: lowercase, strip punctuation, filter short words."""
-        words = text.lower().split()
-        cleaned: list[str] = []
-        for w in words:
-            w = w.strip(".,!?¿¡;:\"'()[]{}—–-")
-            if len(w) > 1:  # Keep words with at least 2 chars
-                cleaned.append(w)
-        return cleaned
+        return [w for token in text.lower().split() if len(w := token.strip(_TOKEN_PUNCT)) > 1]
 
     @staticmethod
     def _normalize(text: str) -> str:
@@ -293,8 +298,8 @@ class PatternDetector:
     def _row_to_pattern(row: tuple) -> Pattern:
         value: dict = {}
         try:
-            value = json.loads(row[3]) if row[3] else {}
-        except (json.JSONDecodeError, TypeError):
+            value = fastjson.loads(row[3]) if row[3] else {}
+        except (fastjson.JSONDecodeError, TypeError):
             pass
 
         return Pattern(
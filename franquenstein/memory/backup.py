@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime
+import os
 from pathlib import Path
 import shutil
+import sqlite3
 
 
 def auto_backup(db_path: Path, keep_last: int = 5) -> Path:
@@ -15,15 +17,48 @@ def auto_backup(db_path: Path, keep_last: int = 5) -> Path:
         keep_last: Number of latest backups to keep
     """
     db_path = db_path.expanduser().resolve()
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup = db_path.parent / f"memory_backup_{ts}.db"
-    shutil.copy2(db_path, backup)
+    with os.scandir(db_path.parent) as entries:
+        backups = sorted(
+            e.name for e in entries
+            if e.name.startswith("memory_backup_") and e.name.endswith(".db")
+        )
 
-    backups = sorted(db_path.parent.glob("memory_backup_*.db"))
+    prefix = "memory_backup_" + datetime.now().strftime("%Y%m%d_%H%M%S")
+    name = f"{prefix}.db"
+    if backups and backups[-1].startswith(prefix):
+        # Several backups within one second: keep numbering up so names sort in order
+        last = backups[-1][len(prefix) + 1:-3]
+        name = f"{prefix}_{int(last or 0) + 1:03d}.db"
+    backup = db_path.parent / name
+
+    try:
+        _sqlite_backup(db_path, backup)
+    except sqlite3.DatabaseError:
+        # Not a readable SQLite file: keep the raw bytes instead
+        shutil.copy2(db_path, backup)
+
+    backups.append(name)
     for old in backups[:-keep_last]:
         try:
-            old.unlink()
-        except Exception:
+            os.unlink(db_path.parent / old)
+        except OSError:
             pass
 
     return backup
+
+
+def _sqlite_backup(db_path: Path, backup: Path) -> None:
+    """Copy a live database with SQLite's online backup API.
+
+    Unlike a file copy, this never captures a half-written page and
+    includes changes still sitting in the WAL file.
+    """
+    src = sqlite3.connect(str(db_path))
+    try:
+        dst = sqlite3.connect(str(backup))
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+    finally:
+        src.close()
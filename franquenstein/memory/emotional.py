@@ -9,10 +9,10 @@ from __future__ import annotations
 
 import sqlite3
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Optional, Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class EmotionalAssociation:
     """Una asociación emocional a un concepto."""
 
@@ -36,6 +36,10 @@ EMOTIONS = [
     "aburrimiento",   # Patrón repetitivo sin novedad
 ]
 
+# Cada emoción → su cadena canónica: valida en O(1) y permite que las
+# filas leídas compartan un único objeto str por emoción
+_CANONICAL_EMOTIONS = {e: e for e in EMOTIONS}
+
 
 class EmotionalMemory:
     """Almacena asociaciones emocionales a conceptos y palabras.
@@ -47,6 +51,7 @@ class EmotionalMemory:
 
     def __init__(self, db_connection: sqlite3.Connection):
         self._conn = db_connection
+        self._mood: Optional[str] = None  # Se recalcula tras cada feel()
 
     # ─── Registrar ───────────────────────────────────────────
 
@@ -61,33 +66,41 @@ class EmotionalMemory:
         Si la asociación ya existe, actualiza la intensidad
         promediándola con la nueva.
         """
-        concept_lower = concept.lower().strip()
-        emotion = emotion if emotion in EMOTIONS else "neutral"
+        self.feel_many((concept,), emotion, intensity)
+
+    def feel_many(
+        self,
+        concepts: Iterable[str],
+        emotion: str,
+        intensity: float = 0.5,
+        commit: bool = True,
+    ) -> None:
+        """Registra la misma emoción para varios conceptos a la vez.
+
+        Equivale a llamar feel() por cada concepto, pero toda la
+        ráfaga se escribe en una sola transacción. Con commit=False
+        queda en la transacción abierta del llamador.
+        """
+        emotion = _CANONICAL_EMOTIONS.get(emotion, "neutral")
         intensity = max(0.0, min(1.0, intensity))
+        rows = [(c.lower().strip(), emotion, intensity) for c in concepts]
+        if not rows:
+            return
 
-        existing = self.get_emotion(concept_lower, emotion)
-        if existing:
-            # Promediar intensidad y contar ocurrencia
-            new_intensity = (existing.intensity * 0.7) + (intensity * 0.3)
-            self._conn.execute(
-                """
-                UPDATE emotional_memory
-                SET intensity = ?,
-                    occurrence_count = occurrence_count + 1,
-                    last_felt = datetime('now')
-                WHERE concept = ? AND emotion = ?
-                """,
-                (new_intensity, concept_lower, emotion),
-            )
-        else:
-            self._conn.execute(
-                """
-                INSERT INTO emotional_memory (concept, emotion, intensity)
-                VALUES (?, ?, ?)
-                """,
-                (concept_lower, emotion, intensity),
-            )
-        self._conn.commit()
+        self._conn.executemany(
+            """
+            INSERT INTO emotional_memory (concept, emotion, intensity)
+            VALUES (?, ?, ?)
+            ON CONFLICT(concept, emotion) DO UPDATE SET
+                intensity = intensity * 0.7 + excluded.intensity * 0.3,
+                occurrence_count = occurrence_count + 1,
+                last_felt = datetime('now')
+            """,
+            rows,
+        )
+        if commit:
+            self._conn.commit()
+        self._mood = None
 
     # ─── Consultar ───────────────────────────────────────────
 
@@ -119,27 +132,66 @@ class EmotionalMemory:
         feelings = self.get_feelings_about(concept)
         return feelings[0] if feelings else None
 
-    def get_mood(self) -> str:
-        """Calcula el 'estado de ánimo' general basado en emociones recientes.
+    def get_dominant_emotions(
+        self, concepts: Sequence[str]
+    ) -> dict[str, EmotionalAssociation]:
+        """Emoción dominante de varios conceptos en una sola consulta.
 
-        Mira las emociones registradas en las últimas interacciones
-        y devuelve la dominante.
+        Devuelve {concepto: asociación} solo para los conceptos con
+        alguna emoción registrada.
         """
-        row = self._conn.execute(
-            """
-            SELECT emotion, SUM(intensity * occurrence_count) as weight
+        keys = list(dict.fromkeys(c.lower().strip() for c in concepts))
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" * len(keys))
+        # SQLite toma las columnas "sueltas" de la fila con MAX(intensity)
+        rows = self._conn.execute(
+            f"""
+            SELECT id, concept, emotion, intensity, occurrence_count, last_felt,
+                   MAX(intensity)
             FROM emotional_memory
-            ORDER BY last_felt DESC
-            LIMIT 20
+            WHERE concept IN ({placeholders})
+            GROUP BY concept
             """,
-        ).fetchone()
+            keys,
+        ).fetchall()
+        return {row[1]: self._row_to_association(row) for row in rows}
 
-        if row and row[0]:
-            return row[0]
-        return "curiosidad"  # Estado por defecto: curioso
+    def get_mood(self) -> str:
+        """Calcula el 'estado de ánimo' general basado en emociones recientes.
+
+        Mira las 20 asociaciones sentidas más recientemente y devuelve
+        la emoción con más peso (intensidad × repeticiones). El resultado
+        se guarda hasta el siguiente feel().
+        """
+        if self._mood is None:
+            row = self._conn.execute(
+                """
+                SELECT emotion, SUM(intensity * occurrence_count) AS weight
+                FROM (
+                    SELECT emotion, intensity, occurrence_count
+                    FROM emotional_memory
+                    ORDER BY last_felt DESC
+                    LIMIT 20
+                )
+                GROUP BY emotion
+                ORDER BY weight DESC
+                LIMIT 1
+                """,
+            ).fetchone()
+            self._mood = row[0] if row and row[0] else "curiosidad"  # Por defecto: curioso
+        return self._mood
 
     def search(self, query: str, limit: int = 10) -> list[EmotionalAssociation]:
         """Busca asociaciones emocionales por concepto."""
+        if not query.strip():
+            # Un texto vacío coincide con todo: sin filtro LIKE
+            rows = self._conn.execute(
+                "SELECT * FROM emotional_memory ORDER BY intensity DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+            return [self._row_to_association(row) for row in rows]
+
         pattern = f"%{query.lower()}%"
         rows = self._conn.execute(
             """
@@ -177,7 +229,7 @@ class EmotionalMemory:
         return EmotionalAssociation(
             id=row[0],
             concept=row[1],
-            emotion=row[2],
+            emotion=_CANONICAL_EMOTIONS.get(row[2], row[2]),
             intensity=row[3],
             occurrence_count=row[4],
             last_felt=row[5],
@@ -6,11 +6,24 @@ con su contexto temporal, emocional y resultado.
 
 from __future__ import annotations
 
-import json
 import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+from franquenstein import fastjson
+
+
+def fts_query(texts: Iterable[str]) -> str:
+    """Convierte textos en una consulta FTS5 que encuentra cualquiera de ellos.
+
+    Cada texto se busca como frase literal (las comillas neutralizan los
+    operadores de FTS5) y su última palabra admite prefijos, para
+    parecerse a la antigua búsqueda LIKE '%texto%'.
+    """
+    return " OR ".join('"' + t.replace('"', '""') + '"*' for t in texts if t.strip())
 
 
 @dataclass
@@ -37,8 +50,9 @@ class EpisodicMemory:
     emoción, feedback, importancia, contexto, timestamps.
     """
 
-    def __init__(self, db_connection: sqlite3.Connection):
+    def __init__(self, db_connection: sqlite3.Connection, fts: bool = False):
         self._conn = db_connection
+        self._fts = fts  # ¿Existe el índice episodic_fts?
 
     # ─── Almacenar ───────────────────────────────────────────
 
@@ -51,8 +65,13 @@ class EpisodicMemory:
         emotion_intensity: float = 0.5,
         feedback_score: float = 0.0,
         importance: float = 0.5,
+        commit: bool = True,
     ) -> int:
-        """Guarda una nueva experiencia y devuelve su ID."""
+        """Guarda una nueva experiencia y devuelve su ID.
+
+        Con commit=False la escritura queda en la transacción abierta,
+        para que el llamador la confirme junto a otras.
+        """
         cursor = self._conn.execute(
             """
             INSERT INTO episodic_memory
@@ -63,33 +82,63 @@ class EpisodicMemory:
             (
                 input_text,
                 output_text,
-                json.dumps(context or {}),
+                fastjson.dumps(context) if context else "{}",
                 emotion,
                 emotion_intensity,
                 feedback_score,
                 importance,
             ),
         )
-        self._conn.commit()
+        if commit:
+            self._conn.commit()
         return cursor.lastrowid  # type: ignore[return-value]
 
     # ─── Recuperar ───────────────────────────────────────────
 
     def recall_recent(self, limit: int = 10) -> list[Episode]:
         """Devuelve las experiencias más recientes."""
-        rows = self._conn.execute(
+        cursor = self._conn.execute(
             """
             SELECT * FROM episodic_memory
             ORDER BY timestamp DESC
             LIMIT ?
             """,
             (limit,),
-        ).fetchall()
-        return [self._row_to_episode(row) for row in rows]
+        )
+        return list(map(self._row_to_episode, cursor))
+
+    def recall_recent_rows(self, limit: int = 10) -> Iterator[tuple[int, float, str]]:
+        """Recorre las experiencias más recientes como (id, feedback_score, emotion).
+
+        Lee las filas directamente del cursor, sin construir objetos Episode.
+        """
+        yield from self._conn.execute(
+            """
+            SELECT id, feedback_score, emotion FROM episodic_memory
+            ORDER BY timestamp DESC
+            LIMIT ?
+            """,
+            (limit,),
+        )
+
+    def recall_recent_feedback_array(self, limit: int = 50) -> np.ndarray:
+        """Puntuaciones de feedback de las experiencias más recientes.
+
+        Lee solo esa columna, sin construir objetos Episode.
+        """
+        cursor = self._conn.execute(
+            """
+            SELECT feedback_score FROM episodic_memory
+            ORDER BY timestamp DESC
+            LIMIT ?
+            """,
+            (limit,),
+        )
+        return np.fromiter((row[0] for row in cursor), dtype=np.float64)
 
     def recall_by_emotion(self, emotion: str, limit: int = 10) -> list[Episode]:
         """Recupera experiencias asociadas a una emoción."""
-        rows = self._conn.execute(
+        cursor = self._conn.execute(
             """
             SELECT * FROM episodic_memory
             WHERE emotion = ?
@@ -97,12 +146,12 @@ class EpisodicMemory:
             LIMIT ?
             """,
             (emotion, limit),
-        ).fetchall()
-        return [self._row_to_episode(row) for row in rows]
+        )
+        return list(map(self._row_to_episode, cursor))
 
     def recall_important(self, min_importance: float = 0.7, limit: int = 10) -> list[Episode]:
         """Recupera las experiencias más importantes."""
-        rows = self._conn.execute(
+        cursor = self._conn.execute(
             """
             SELECT * FROM episodic_memory
             WHERE importance >= ?
@@ -110,15 +159,15 @@ class EpisodicMemory:
             LIMIT ?
             """,
             (min_importance, limit),
-        ).fetchall()
-        return [self._row_to_episode(row) for row in rows]
+        )
+        return list(map(self._row_to_episode, cursor))
 
     def recall_best_feedback(self, min_feedback: float = 0.5, limit: int = 5) -> list[Episode]:
         """Recupera experiencias con feedback positivo alto.
 
         Útil para dar ejemplos de "buenas respuestas" al módulo de razonamiento.
         """
-        rows = self._conn.execute(
+        cursor = self._conn.execute(
             """
             SELECT * FROM episodic_memory
             WHERE feedback_score >= ?
@@ -126,25 +175,55 @@ class EpisodicMemory:
             LIMIT ?
             """,
             (min_feedback, limit),
-        ).fetchall()
-        return [self._row_to_episode(row) for row in rows]
+        )
+        return list(map(self._row_to_episode, cursor))
 
     def search(self, query: str, limit: int = 10) -> list[Episode]:
         """Busca experiencias que contengan el texto dado."""
-        pattern = f"%{query}%"
-        rows = self._conn.execute(
-            """
-            SELECT * FROM episodic_memory
-            WHERE input_text LIKE ? OR output_text LIKE ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-            """,
-            (pattern, pattern, limit),
-        ).fetchall()
+        return self.search_any([query], limit=limit)
+
+    def search_any(self, queries: list[str], limit: int = 10) -> list[Episode]:
+        """Busca experiencias que contengan cualquiera de los textos dados.
 
-        # Incrementar contador de acceso
-        for row in rows:
-            self._touch(row[0])
+        Equivale a varias llamadas a search() resueltas en una sola consulta.
+        Usa el índice FTS5 (ordenado por relevancia) si está disponible.
+        """
+        if not queries:
+            return []
+        match = fts_query(queries) if self._fts else ""
+        if not all(q.strip() for q in queries):
+            # Un texto vacío coincide con todo: basta con las más recientes
+            rows = self._conn.execute(
+                "SELECT * FROM episodic_memory ORDER BY timestamp DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        elif match:
+            rows = self._conn.execute(
+                """
+                SELECT e.* FROM episodic_fts
+                JOIN episodic_memory e ON e.id = episodic_fts.rowid
+                WHERE episodic_fts MATCH ?
+                ORDER BY episodic_fts.rank
+                LIMIT ?
+                """,
+                (match, limit),
+            ).fetchall()
+        else:
+            patterns = [f"%{q}%" for q in queries]
+            where = " OR ".join(["input_text LIKE ? OR output_text LIKE ?"] * len(patterns))
+            params = [p for p in patterns for _ in range(2)]
+            rows = self._conn.execute(
+                f"""
+                SELECT * FROM episodic_memory
+                WHERE {where}
+                ORDER BY timestamp DESC
+                LIMIT ?
+                """,
+                (*params, limit),
+            ).fetchall()
+
+        # Incrementar contador de acceso (una sola escritura para todos)
+        self._touch_many([row[0] for row in rows])
 
         return [self._row_to_episode(row) for row in rows]
 
@@ -155,7 +234,7 @@ class EpisodicMemory:
             (episode_id,),
         ).fetchone()
         if row:
-            self._touch(episode_id)
+            self._touch_many([episode_id])
             return self._row_to_episode(row)
         return None
 
@@ -195,11 +274,10 @@ class EpisodicMemory:
             """
             UPDATE episodic_memory
             SET importance = importance * ?
-            WHERE last_accessed IS NOT NULL
-              AND julianday('now') - julianday(last_accessed) > ?
+            WHERE last_accessed < datetime('now', ?)
               AND importance > 0.1
             """,
-            (decay_factor, days_threshold),
+            (decay_factor, f"-{days_threshold} days"),
         )
         self._conn.commit()
         return cursor.rowcount
@@ -211,7 +289,16 @@ class EpisodicMemory:
 
     def get_frequent_patterns(self, min_count: int = 3) -> list[dict]:
         """Identifica inputs que se repiten frecuentemente (para consolidación)."""
-        rows = self._conn.execute(
+        return [
+            {"input": input_text, "frequency": freq, "avg_feedback": avg_feedback}
+            for input_text, freq, avg_feedback in self.get_frequent_pattern_rows(min_count)
+        ]
+
+    def get_frequent_pattern_rows(self, min_count: int = 3) -> list[tuple[str, int, float]]:
+        """Como get_frequent_patterns, pero con las filas tal cual salen de SQLite:
+        (input_text, frecuencia, feedback medio), sin construir diccionarios.
+        """
+        return self._conn.execute(
             """
             SELECT input_text, COUNT(*) as freq, AVG(feedback_score) as avg_feedback
             FROM episodic_memory
@@ -221,45 +308,49 @@ class EpisodicMemory:
             """,
             (min_count,),
         ).fetchall()
-        return [
-            {"input": row[0], "frequency": row[1], "avg_feedback": row[2]}
-            for row in rows
-        ]
 
     # ─── Privado ─────────────────────────────────────────────
 
-    def _touch(self, episode_id: int) -> None:
-        """Actualiza el timestamp y contador de acceso."""
+    def _touch_many(self, episode_ids: list[int]) -> None:
+        """Actualiza el timestamp y contador de acceso de varias experiencias."""
+        if not episode_ids:
+            return
+        placeholders = ",".join("?" * len(episode_ids))
         self._conn.execute(
-            """
+            f"""
             UPDATE episodic_memory
             SET access_count = access_count + 1,
                 last_accessed = datetime('now')
-            WHERE id = ?
+            WHERE id IN ({placeholders})
             """,
-            (episode_id,),
+            episode_ids,
         )
         self._conn.commit()
 
     @staticmethod
     def _row_to_episode(row: tuple) -> Episode:
         """Convierte una fila de SQLite en un Episode."""
+        (id_, timestamp, input_text, output_text, raw_context, emotion,
+         emotion_intensity, feedback_score, access_count, last_accessed,
+         importance) = row
+
         context = {}
-        try:
-            context = json.loads(row[4]) if row[4] else {}
-        except (json.JSONDecodeError, TypeError):
-            pass
+        if raw_context and raw_context != "{}":  # store() guarda "{}" casi siempre
+            try:
+                context = fastjson.loads(raw_context)
+            except (fastjson.JSONDecodeError, TypeError):
+                pass
 
         return Episode(
-            id=row[0],
-            timestamp=row[1],
-            input_text=row[2],
-            output_text=row[3],
+            id=id_,
+            timestamp=timestamp,
+            input_text=input_text,
+            output_text=output_text,
             context=context,
-            emotion=row[5],
-            emotion_intensity=row[6],
-            feedback_score=row[7],
-            access_count=row[8],
-            last_accessed=row[9],
-            importance=row[10],
+            emotion=emotion,
+            emotion_intensity=emotion_intensity,
+            feedback_score=feedback_score,
+            access_count=access_count,
+            last_accessed=last_accessed,
+            importance=importance,
         )
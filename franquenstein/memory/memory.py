@@ -8,6 +8,8 @@ and handles consolidation (episodic → semantic).
 from __future__ import annotations
 
 import sqlite3
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -18,6 +20,45 @@ from franquenstein.memory.semantic import SemanticMemory, Concept
 from franquenstein.memory.emotional import EmotionalMemory, EmotionalAssociation
 
 
+def open_connection(db_path: Path, check_same_thread: bool = True) -> sqlite3.Connection:
+    """Connect to a Franquenstein database with the standard pragmas."""
+    conn = sqlite3.connect(
+        str(db_path),
+        check_same_thread=check_same_thread,
+        cached_statements=256,  # Reuse prepared statements across the hot paths
+    )
+    # Only takes effect on a new, empty database (must precede WAL)
+    conn.execute("PRAGMA page_size=8192")
+    conn.execute("PRAGMA journal_mode=WAL")  # Better concurrent access
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA cache_size=-32000")  # ~32MB page cache
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256MB memory-mapped reads
+    conn.execute("PRAGMA wal_autocheckpoint=1000")  # Checkpoint every ~1000 WAL pages
+    conn.execute("PRAGMA foreign_keys=ON")
+    return conn
+
+
+_KEY_WORD_STOP_WORDS = frozenset({
+    "el", "la", "los", "las", "un", "una", "de", "del", "en",
+    "y", "o", "a", "que", "es", "se", "no", "por", "con",
+    "the", "a", "an", "is", "are", "was", "were", "in", "on",
+    "at", "to", "for", "of", "and", "or", "but", "not", "with",
+    "i", "you", "he", "she", "it", "we", "they", "my", "your",
+    "yo", "tu", "su", "mi", "me", "te", "nos",
+})
+_KEY_WORD_PUNCT = ".,!?¿¡;:\"'()[]{}"
+
+
+@lru_cache(maxsize=1024)
+def _key_words(text: str) -> tuple[str, ...]:
+    return tuple(
+        word for w in text.lower().split()
+        if len(w) > 2 and (word := w.strip(_KEY_WORD_PUNCT)) not in _KEY_WORD_STOP_WORDS
+    )
+
+
 class MemorySystem:
     """Orchestrates the 4-layer memory system.
 
@@ -31,11 +72,12 @@ class MemorySystem:
     def __init__(self, db_path: Optional[Path] = None):
         self._db_path = db_path or cfg.DB_PATH
         self._conn = self._init_database()
+        fts = self._init_fts()
 
         # Initialize all memory layers
         self.working = WorkingMemory()
-        self.episodic = EpisodicMemory(self._conn)
-        self.semantic = SemanticMemory(self._conn)
+        self.episodic = EpisodicMemory(self._conn, fts=fts)
+        self.semantic = SemanticMemory(self._conn, fts=fts)
         self.emotional = EmotionalMemory(self._conn)
 
     # ─── Database ────────────────────────────────────────────
@@ -43,12 +85,7 @@ class MemorySystem:
     def _init_database(self) -> sqlite3.Connection:
         """Initialize SQLite database with schema."""
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(self._db_path))
-        conn.execute("PRAGMA journal_mode=WAL")  # Better concurrent access
-        conn.execute("PRAGMA synchronous=NORMAL")
-        conn.execute("PRAGMA busy_timeout=5000")
-        conn.execute("PRAGMA cache_size=-8000")  # ~8MB page cache
-        conn.execute("PRAGMA foreign_keys=ON")
+        conn = open_connection(self._db_path)
 
         # Load and execute schema
         schema_path = Path(__file__).parent / "schema.sql"
@@ -57,6 +94,40 @@ class MemorySystem:
 
         return conn
 
+    def _init_fts(self) -> bool:
+        """Create the FTS5 search indexes; False if SQLite lacks FTS5.
+
+        Indexes created for the first time are filled from the
+        existing rows, so older databases become searchable too.
+        """
+        fts_tables = ("episodic_fts", "semantic_fts")
+        existing = {
+            row[0] for row in self._conn.execute(
+                "SELECT name FROM sqlite_master WHERE name IN (?, ?)", fts_tables
+            )
+        }
+        schema_path = Path(__file__).parent / "schema_fts.sql"
+        try:
+            with open(schema_path, "r", encoding="utf-8") as f:
+                self._conn.executescript(f.read())
+        except sqlite3.OperationalError:
+            return False  # Built without FTS5: searches fall back to LIKE
+
+        with self._conn:
+            for table in fts_tables:
+                if table not in existing:
+                    self._conn.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+        return True
+
+    def open_connection(self) -> sqlite3.Connection:
+        """Open an extra connection to the same database.
+
+        Lets a component do its own I/O from a worker thread while the
+        main connection keeps serving the memory layers (WAL mode allows
+        one writer and concurrent readers). The caller owns and closes it.
+        """
+        return open_connection(self._db_path, check_same_thread=False)
+
     # ─── High-level API ──────────────────────────────────────
 
     def remember(
@@ -67,12 +138,14 @@ class MemorySystem:
         emotion_intensity: float = 0.5,
         feedback_score: float = 0.0,
         importance: float = 0.5,
+        commit: bool = True,
     ) -> int:
         """Store a complete interaction across all relevant memory layers.
 
         This is the main method for recording new experiences.
         It stores in working memory, episodic memory, and
-        registers emotional associations.
+        registers emotional associations. With commit=False the writes
+        stay in the caller's open transaction.
 
         Returns:
             The episode ID from episodic memory.
@@ -84,20 +157,23 @@ class MemorySystem:
             emotion=emotion,
         ))
 
-        # 2. Episodic memory — persistent experience
-        episode_id = self.episodic.store(
-            input_text=input_text,
-            output_text=output_text,
-            emotion=emotion,
-            emotion_intensity=emotion_intensity,
-            feedback_score=feedback_score,
-            importance=importance,
-        )
+        # 2 + 3 share one transaction: a single commit per interaction
+        with self._conn if commit else nullcontext():
+            # 2. Episodic memory — persistent experience
+            episode_id = self.episodic.store(
+                input_text=input_text,
+                output_text=output_text,
+                emotion=emotion,
+                emotion_intensity=emotion_intensity,
+                feedback_score=feedback_score,
+                importance=importance,
+                commit=False,
+            )
 
-        # 3. Emotional memory — associate emotions with key words
-        words = self._extract_key_words(input_text)
-        for word in words:
-            self.emotional.feel(word, emotion, emotion_intensity)
+            # 3. Emotional memory — associate emotions with key words
+            self.emotional.feel_many(
+                _key_words(input_text), emotion, emotion_intensity, commit=False
+            )
 
         return episode_id
 
@@ -139,21 +215,10 @@ class MemorySystem:
         Returns:
             Number of new concepts consolidated.
         """
-        patterns = self.episodic.get_frequent_patterns(
+        patterns = self.episodic.get_frequent_pattern_rows(
             min_count=cfg.CONSOLIDATION_THRESHOLD
         )
-        consolidated = 0
-
-        for pattern in patterns:
-            concept_id = self.semantic.consolidate_from_episodes(
-                input_text=pattern["input"],
-                frequency=pattern["frequency"],
-                avg_feedback=pattern["avg_feedback"],
-            )
-            if concept_id is not None:
-                consolidated += 1
-
-        return consolidated
+        return self.semantic.bulk_consolidate(patterns)
 
     def maintenance(self) -> dict:
         """Perform memory maintenance: decay old memories, consolidate patterns.
@@ -182,6 +247,33 @@ class MemorySystem:
         )
         self._conn.commit()
 
+    def save_state_many(self, values: dict[str, str]) -> None:
+        """Save several key-value pairs in a single transaction."""
+        if not values:
+            return
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO being_state (key, value, updated_at)
+                VALUES (?, ?, datetime('now'))
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = datetime('now')
+                """,
+                values.items(),
+            )
+
+    def append_state(self, key: str, text: str) -> None:
+        """Append text to a being-state value, creating it if missing."""
+        self._conn.execute(
+            """
+            INSERT INTO being_state (key, value, updated_at)
+            VALUES (?, ?, datetime('now'))
+            ON CONFLICT(key) DO UPDATE SET
+                value = value || excluded.value, updated_at = datetime('now')
+            """,
+            (key, text),
+        )
+        self._conn.commit()
+
     def load_state(self, key: str, default: str = "") -> str:
         """Load a value from persistent being state."""
         row = self._conn.execute(
@@ -190,6 +282,15 @@ class MemorySystem:
         ).fetchone()
         return row[0] if row else default
 
+    @property
+    def change_count(self) -> int:
+        """Rows changed through the main connection since it was opened.
+
+        Cheap to read; consumers use it to tell whether cached
+        statistics could be stale.
+        """
+        return self._conn.total_changes
+
     # ─── Statistics ──────────────────────────────────────────
 
     def get_stats(self) -> dict:
@@ -209,26 +310,16 @@ class MemorySystem:
         """Extract meaningful words from text (simple approach).
 
         Filters out very short words and common stop words.
-        This can evolve as the being learns.
+        This can evolve as the being learns. Results are memoized, since
+        the same input is tokenized by several layers in one interaction.
         """
-        stop_words = {
-            "el", "la", "los", "las", "un", "una", "de", "del", "en",
-            "y", "o", "a", "que", "es", "se", "no", "por", "con",
-            "the", "a", "an", "is", "are", "was", "were", "in", "on",
-            "at", "to", "for", "of", "and", "or", "but", "not", "with",
-            "i", "you", "he", "she", "it", "we", "they", "my", "your",
-            "yo", "tu", "su", "mi", "me", "te", "nos",
-        }
-        words = text.lower().split()
-        return [
-            w.strip(".,!?¿¡;:\"'()[]{}") for w in words
-            if len(w) > 2 and w.lower().strip(".,!?¿¡;:\"'()[]{}") not in stop_words
-        ]
+        return list(_key_words(text))
 
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connection (no-op if already closed)."""
         if self._conn:
             self._conn.close()
+            self._conn = None
 
     def __enter__(self):
         return self
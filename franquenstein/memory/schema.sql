@@ -22,13 +22,20 @@ CREATE TABLE IF NOT EXISTS semantic_memory (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     concept TEXT NOT NULL UNIQUE,
     definition TEXT,
-    associations TEXT,              -- JSON: lista de conceptos relacionados
+    associations TEXT,              -- Obsoleto: ahora en concept_associations
     confidence REAL DEFAULT 0.1,    -- 0.0 a 1.0, crece con repetición
     source_count INTEGER DEFAULT 1, -- Cuántas experiencias lo originaron
     first_learned TEXT NOT NULL DEFAULT (datetime('now')),
     last_reinforced TEXT NOT NULL DEFAULT (datetime('now'))
 );
 
+-- Asociaciones entre conceptos: una fila por par
+CREATE TABLE IF NOT EXISTS concept_associations (
+    concept_id INTEGER NOT NULL REFERENCES semantic_memory(id) ON DELETE CASCADE,
+    associated TEXT NOT NULL,         -- Nombre del concepto asociado
+    PRIMARY KEY (concept_id, associated)
+) WITHOUT ROWID;
+
 -- Memoria Emocional: asociaciones sentimentales a conceptos
 CREATE TABLE IF NOT EXISTS emotional_memory (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -53,6 +60,15 @@ CREATE TABLE IF NOT EXISTS patterns (
     UNIQUE(pattern_type, pattern_key)
 );
 
+-- Respuestas candidatas de cada response_pattern, una fila por salida
+CREATE TABLE IF NOT EXISTS response_variants (
+    pattern_key TEXT NOT NULL,        -- Entrada normalizada (patterns.pattern_key)
+    output TEXT NOT NULL,
+    score REAL NOT NULL DEFAULT 0.0,  -- Media móvil del feedback
+    count INTEGER NOT NULL DEFAULT 1,
+    UNIQUE(pattern_key, output)
+);
+
 -- Estado del ser digital: nivel, métricas, etc.
 CREATE TABLE IF NOT EXISTS being_state (
     key TEXT PRIMARY KEY,
@@ -62,9 +78,19 @@ CREATE TABLE IF NOT EXISTS being_state (
 
 -- Índices para búsquedas rápidas
 CREATE INDEX IF NOT EXISTS idx_episodic_timestamp ON episodic_memory(timestamp);
-CREATE INDEX IF NOT EXISTS idx_episodic_emotion ON episodic_memory(emotion);
-CREATE INDEX IF NOT EXISTS idx_episodic_importance ON episodic_memory(importance);
+CREATE INDEX IF NOT EXISTS idx_episodic_emotion_rank ON episodic_memory(emotion, emotion_intensity DESC, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_episodic_importance_rank ON episodic_memory(importance DESC, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_episodic_feedback_rank ON episodic_memory(feedback_score DESC, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_episodic_last_accessed ON episodic_memory(last_accessed);
+CREATE INDEX IF NOT EXISTS idx_episodic_input_feedback ON episodic_memory(input_text, feedback_score);
 CREATE INDEX IF NOT EXISTS idx_semantic_concept ON semantic_memory(concept);
-CREATE INDEX IF NOT EXISTS idx_semantic_confidence ON semantic_memory(confidence);
+CREATE INDEX IF NOT EXISTS idx_semantic_confidence_rank ON semantic_memory(confidence, last_reinforced);
 CREATE INDEX IF NOT EXISTS idx_emotional_concept ON emotional_memory(concept);
 CREATE INDEX IF NOT EXISTS idx_patterns_type_key ON patterns(pattern_type, pattern_key);
+CREATE INDEX IF NOT EXISTS idx_patterns_type_freq ON patterns(pattern_type, frequency DESC);
+CREATE INDEX IF NOT EXISTS idx_emotional_last_felt ON emotional_memory(last_felt DESC);
+
+-- Índices de una sola columna sustituidos por los *_rank de arriba
+DROP INDEX IF EXISTS idx_episodic_emotion;
+DROP INDEX IF EXISTS idx_episodic_importance;
+DROP INDEX IF EXISTS idx_semantic_confidence;
@@ -0,0 +1,51 @@
+-- ═══════════════════════════════════════════════════════════
+-- Franquenstein — Índices de texto completo (FTS5)
+-- ═══════════════════════════════════════════════════════════
+-- Tablas FTS5 de contenido externo: guardan solo el índice invertido
+-- y leen el texto de la tabla original. Los triggers las mantienen
+-- sincronizadas. Se cargan aparte porque no todo SQLite trae FTS5.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS episodic_fts USING fts5(
+    input_text, output_text,
+    content='episodic_memory', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS episodic_fts_ai AFTER INSERT ON episodic_memory BEGIN
+    INSERT INTO episodic_fts(rowid, input_text, output_text)
+    VALUES (new.id, new.input_text, new.output_text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS episodic_fts_ad AFTER DELETE ON episodic_memory BEGIN
+    INSERT INTO episodic_fts(episodic_fts, rowid, input_text, output_text)
+    VALUES ('delete', old.id, old.input_text, old.output_text);
+END;
+
+-- Solo cuando cambia el texto (no en cada acceso o feedback)
+CREATE TRIGGER IF NOT EXISTS episodic_fts_au AFTER UPDATE OF input_text, output_text ON episodic_memory BEGIN
+    INSERT INTO episodic_fts(episodic_fts, rowid, input_text, output_text)
+    VALUES ('delete', old.id, old.input_text, old.output_text);
+    INSERT INTO episodic_fts(rowid, input_text, output_text)
+    VALUES (new.id, new.input_text, new.output_text);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS semantic_fts USING fts5(
+    concept, definition,
+    content='semantic_memory', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS semantic_fts_ai AFTER INSERT ON semantic_memory BEGIN
+    INSERT INTO semantic_fts(rowid, concept, definition)
+    VALUES (new.id, new.concept, new.definition);
+END;
+
+CREATE TRIGGER IF NOT EXISTS semantic_fts_ad AFTER DELETE ON semantic_memory BEGIN
+    INSERT INTO semantic_fts(semantic_fts, rowid, concept, definition)
+    VALUES ('delete', old.id, old.concept, old.definition);
+END;
+
+CREATE TRIGGER IF NOT EXISTS semantic_fts_au AFTER UPDATE OF concept, definition ON semantic_memory BEGIN
+    INSERT INTO semantic_fts(semantic_fts, rowid, concept, definition)
+    VALUES ('delete', old.id, old.concept, old.definition);
+    INSERT INTO semantic_fts(rowid, concept, definition)
+    VALUES (new.id, new.concept, new.definition);
+END;
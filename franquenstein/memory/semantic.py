@@ -7,10 +7,28 @@ desde la memoria episódica cuando se repiten lo suficiente.
 
 from __future__ import annotations
 
-import json
 import sqlite3
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterable, Optional, Sequence
+
+from franquenstein.memory.episodic import fts_query
+
+# Parámetros máximos por consulta IN (...)
+_MAX_SQL_PARAMS = 900
+
+# Conceptos guardados en la caché de get_concept
+_CONCEPT_CACHE_SIZE = 2048
+
+# Aprende un concepto (concept, definition, confidence) o lo refuerza si existe
+_LEARN_CONCEPT_SQL = """
+    INSERT INTO semantic_memory (concept, definition, confidence)
+    VALUES (?, ?, ?)
+    ON CONFLICT(concept) DO UPDATE SET
+        confidence = MIN(1.0, confidence + 0.1),
+        source_count = source_count + 1,
+        last_reinforced = datetime('now')
+"""
 
 
 @dataclass
@@ -35,8 +53,16 @@ class SemanticMemory:
     cada refuerzo.
     """
 
-    def __init__(self, db_connection: sqlite3.Connection):
+    def __init__(self, db_connection: sqlite3.Connection, fts: bool = False):
         self._conn = db_connection
+        self._fts = fts  # ¿Existe el índice semantic_fts?
+        # Nombres de conceptos conocidos por (min_confidence, limit);
+        # se invalida con cada escritura que cambia conceptos o confianza
+        self._known_cache: dict[tuple[float, int], tuple[str, ...]] = {}
+        # Nombre → concepto (o None si no existe), en orden LRU; cada
+        # escritura descarta las entradas de los conceptos que toca
+        self._concepts: OrderedDict[str, Optional[Concept]] = OrderedDict()
+        self._migrate_associations()
 
     # ─── Almacenar / Reforzar ────────────────────────────────
 
@@ -49,46 +75,44 @@ class SemanticMemory:
     ) -> int:
         """Aprende un concepto nuevo o refuerza uno existente.
 
-        Si el concepto ya existe, incrementa su confianza y source_count.
+        Si el concepto ya existe, incrementa su confianza y source_count
+        (un único UPSERT) y le añade las asociaciones nuevas.
         """
         concept_lower = concept.lower().strip()
-        existing = self.get_concept(concept_lower)
+        with self._conn:
+            row = self._conn.execute(
+                _LEARN_CONCEPT_SQL + " RETURNING id",
+                (concept_lower, definition, initial_confidence),
+            ).fetchone()
+            if associations:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO concept_associations VALUES (?, ?)",
+                    [(row[0], assoc) for assoc in associations],
+                )
+        self._known_cache.clear()
+        self._concepts.pop(concept_lower, None)
+        return row[0]
+
+    def learn_concepts_bulk(
+        self,
+        concepts: Sequence[str],
+        definition: str = "",
+        initial_confidence: float = 0.1,
+    ) -> None:
+        """Aprende o refuerza varios conceptos en una sola transacción.
 
-        if existing:
-            # Reforzar concepto existente
-            new_confidence = min(1.0, existing.confidence + 0.1)
-            new_associations = list(
-                set(existing.associations + (associations or []))
-            )
-            self._conn.execute(
-                """
-                UPDATE semantic_memory
-                SET confidence = ?,
-                    source_count = source_count + 1,
-                    associations = ?,
-                    last_reinforced = datetime('now')
-                WHERE concept = ?
-                """,
-                (new_confidence, json.dumps(new_associations), concept_lower),
-            )
-            self._conn.commit()
-            return existing.id  # type: ignore[return-value]
-        else:
-            # Aprender concepto nuevo
-            cursor = self._conn.execute(
-                """
-                INSERT INTO semantic_memory (concept, definition, associations, confidence)
-                VALUES (?, ?, ?, ?)
-                """,
-                (
-                    concept_lower,
-                    definition,
-                    json.dumps(associations or []),
-                    initial_confidence,
-                ),
+        Equivale a llamar learn_concept por cada concepto (sin
+        asociaciones), pero con un único UPSERT preparado.
+        """
+        keys = [c.lower().strip() for c in concepts]
+        with self._conn:
+            self._conn.executemany(
+                _LEARN_CONCEPT_SQL,
+                [(key, definition, initial_confidence) for key in keys],
             )
-            self._conn.commit()
-            return cursor.lastrowid  # type: ignore[return-value]
+        self._known_cache.clear()
+        for key in keys:
+            self._concepts.pop(key, None)
 
     def add_association(self, concept: str, associated_concept: str) -> bool:
         """Añade una asociación entre dos conceptos."""
@@ -97,26 +121,84 @@ class SemanticMemory:
         if not existing:
             return False
 
-        associations = list(set(existing.associations + [associated_concept.lower().strip()]))
         self._conn.execute(
-            "UPDATE semantic_memory SET associations = ? WHERE concept = ?",
-            (json.dumps(associations), concept_lower),
+            "INSERT OR IGNORE INTO concept_associations VALUES (?, ?)",
+            (existing.id, associated_concept.lower().strip()),
         )
         self._conn.commit()
+        self._concepts.pop(concept_lower, None)
         return True
 
     # ─── Recuperar ───────────────────────────────────────────
 
     def get_concept(self, concept: str) -> Optional[Concept]:
         """Busca un concepto por nombre exacto."""
+        key = concept.lower().strip()
+        if key in self._concepts:
+            self._concepts.move_to_end(key)
+            return self._concepts[key]
+
         row = self._conn.execute(
             "SELECT * FROM semantic_memory WHERE concept = ?",
-            (concept.lower().strip(),),
+            (key,),
         ).fetchone()
-        return self._row_to_concept(row) if row else None
+        found = self._rows_to_concepts([row])[0] if row else None
+        self._cache_concept(key, found)
+        return found
+
+    def get_concepts_by_names(self, names: list[str]) -> list[Concept]:
+        """Busca varios conceptos por nombre exacto en una sola consulta.
+
+        Devuelve los encontrados ordenados por confianza descendente.
+        """
+        keys = list(dict.fromkeys(n.lower().strip() for n in names))
+        if not keys:
+            return []
+        rows = []
+        # Trozos bajo el límite de parámetros de SQLite (999 en builds antiguos)
+        for start in range(0, len(keys), _MAX_SQL_PARAMS):
+            chunk = keys[start:start + _MAX_SQL_PARAMS]
+            placeholders = ", ".join("?" * len(chunk))
+            rows.extend(self._conn.execute(
+                f"""
+                SELECT * FROM semantic_memory
+                WHERE concept IN ({placeholders})
+                ORDER BY confidence DESC
+                """,
+                chunk,
+            ).fetchall())
+        concepts = self._rows_to_concepts(rows)
+        if len(keys) > _MAX_SQL_PARAMS:
+            concepts.sort(key=lambda c: c.confidence, reverse=True)
+        return concepts
 
     def search(self, query: str, limit: int = 10) -> list[Concept]:
-        """Busca conceptos que contengan el texto dado."""
+        """Busca conceptos que contengan el texto dado.
+
+        Usa el índice FTS5 (ordenado por relevancia) si está disponible.
+        """
+        if not query.strip():
+            # Un texto vacío coincide con todo: basta con los más confiables
+            rows = self._conn.execute(
+                "SELECT * FROM semantic_memory ORDER BY confidence DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+            return self._rows_to_concepts(rows)
+
+        match = fts_query([query]) if self._fts else ""
+        if match:
+            rows = self._conn.execute(
+                """
+                SELECT s.* FROM semantic_fts
+                JOIN semantic_memory s ON s.id = semantic_fts.rowid
+                WHERE semantic_fts MATCH ?
+                ORDER BY semantic_fts.rank
+                LIMIT ?
+                """,
+                (match, limit),
+            ).fetchall()
+            return self._rows_to_concepts(rows)
+
         pattern = f"%{query.lower()}%"
         rows = self._conn.execute(
             """
@@ -127,7 +209,7 @@ class SemanticMemory:
             """,
             (pattern, pattern, limit),
         ).fetchall()
-        return [self._row_to_concept(row) for row in rows]
+        return self._rows_to_concepts(rows)
 
     def get_related(self, concept: str, limit: int = 5) -> list[Concept]:
         """Encuentra conceptos relacionados (por asociaciones)."""
@@ -135,12 +217,16 @@ class SemanticMemory:
         if not main or not main.associations:
             return []
 
-        related: list[Concept] = []
-        for assoc in main.associations[:limit]:
-            c = self.get_concept(assoc)
-            if c:
-                related.append(c)
-        return related
+        # Una sola consulta IN para las asociaciones que no están en caché
+        names = [assoc.lower().strip() for assoc in main.associations[:limit]]
+        found = {name: self._concepts[name] for name in names if name in self._concepts}
+        missing = [name for name in names if name not in found]
+        if missing:
+            fetched = {c.concept: c for c in self.get_concepts_by_names(missing)}
+            for name in missing:
+                found[name] = fetched.get(name)
+                self._cache_concept(name, found[name])
+        return [found[name] for name in names if found[name]]
 
     def get_confident(self, min_confidence: float = 0.5, limit: int = 20) -> list[Concept]:
         """Devuelve conceptos con alta confianza (bien aprendidos)."""
@@ -153,7 +239,30 @@ class SemanticMemory:
             """,
             (min_confidence, limit),
         ).fetchall()
-        return [self._row_to_concept(row) for row in rows]
+        return self._rows_to_concepts(rows)
+
+    def get_known_concepts(
+        self, min_confidence: float = 0.2, limit: int = 50
+    ) -> tuple[str, ...]:
+        """Nombres de los conceptos más confiables, de mayor a menor.
+
+        El resultado se reutiliza hasta el siguiente aprendizaje, así
+        varias llamadas al razonador no repiten la consulta.
+        """
+        key = (min_confidence, limit)
+        known = self._known_cache.get(key)
+        if known is None:
+            rows = self._conn.execute(
+                """
+                SELECT concept FROM semantic_memory
+                WHERE confidence >= ?
+                ORDER BY confidence DESC
+                LIMIT ?
+                """,
+                key,
+            ).fetchall()
+            known = self._known_cache[key] = tuple(row[0] for row in rows)
+        return known
 
     def get_least_confident(self, limit: int = 10) -> list[Concept]:
         """Devuelve conceptos menos confiados (candidatos para curiosidad)."""
@@ -165,7 +274,37 @@ class SemanticMemory:
             """,
             (limit,),
         ).fetchall()
-        return [self._row_to_concept(row) for row in rows]
+        return self._rows_to_concepts(rows)
+
+    def record_exploration(
+        self,
+        concept: str,
+        definition: str,
+        max_confidence: float = 0.6,
+        commit: bool = True,
+    ) -> None:
+        """Guarda lo aprendido al explorar un concepto por curiosidad.
+
+        Sustituye la definición y sube la confianza 0.1 (sin pasar de
+        max_confidence ni bajarla) en un único UPDATE. Con commit=False
+        queda en la transacción abierta del llamador.
+        """
+        concept_lower = concept.lower().strip()
+        self._conn.execute(
+            """
+            UPDATE semantic_memory
+            SET definition = ?,
+                confidence = MAX(confidence, MIN(?, confidence + 0.1)),
+                source_count = source_count + 1,
+                last_reinforced = datetime('now')
+            WHERE concept = ?
+            """,
+            (definition, max_confidence, concept_lower),
+        )
+        if commit:
+            self._conn.commit()
+        self._known_cache.clear()
+        self._concepts.pop(concept_lower, None)
 
     # ─── Consolidación ───────────────────────────────────────
 
@@ -180,6 +319,45 @@ class SemanticMemory:
         Se llama cuando la memoria episódica detecta que un input
         se ha repetido lo suficiente.
         """
+        row = self._consolidation_row(input_text, frequency, avg_feedback)
+        if row is None:
+            return None
+        concept_key, definition, confidence = row
+        return self.learn_concept(
+            concept=concept_key,
+            definition=definition,
+            initial_confidence=confidence,
+        )
+
+    def bulk_consolidate(self, patterns: Iterable[tuple[str, int, float]]) -> int:
+        """Consolida varios patrones episódicos en una sola transacción.
+
+        Equivale a llamar consolidate_from_episodes por cada patrón
+        (input_text, frecuencia, feedback medio), como los devuelve
+        EpisodicMemory.get_frequent_pattern_rows.
+
+        Returns:
+            Número de patrones consolidados.
+        """
+        rows = [
+            row for pattern in patterns
+            if (row := self._consolidation_row(*pattern))
+        ]
+        if not rows:
+            return 0
+
+        with self._conn:
+            self._conn.executemany(_LEARN_CONCEPT_SQL, rows)
+        self._known_cache.clear()
+        for concept_key, _, _ in rows:
+            self._concepts.pop(concept_key, None)
+        return len(rows)
+
+    @staticmethod
+    def _consolidation_row(
+        input_text: str, frequency: int, avg_feedback: float
+    ) -> Optional[tuple[str, str, float]]:
+        """(concepto, definición, confianza) para un patrón, o None si está vacío."""
         # Extraer palabras clave del input como concepto
         words = input_text.lower().strip().split()
         if not words:
@@ -189,11 +367,7 @@ class SemanticMemory:
         concept_key = input_text.lower().strip() if len(words) <= 3 else " ".join(words[:3])
 
         confidence = min(1.0, 0.1 + (frequency * 0.1) + max(0, avg_feedback * 0.2))
-        return self.learn_concept(
-            concept=concept_key,
-            definition=f"Patrón consolidado de {frequency} experiencias",
-            initial_confidence=confidence,
-        )
+        return concept_key, f"Patrón consolidado de {frequency} experiencias", confidence
 
     # ─── Estadísticas ────────────────────────────────────────
 
@@ -208,21 +382,68 @@ class SemanticMemory:
 
     # ─── Privado ─────────────────────────────────────────────
 
-    @staticmethod
-    def _row_to_concept(row: tuple) -> Concept:
-        associations: list[str] = []
-        try:
-            associations = json.loads(row[3]) if row[3] else []
-        except (json.JSONDecodeError, TypeError):
-            pass
-
-        return Concept(
-            id=row[0],
-            concept=row[1],
-            definition=row[2] or "",
-            associations=associations,
-            confidence=row[4],
-            source_count=row[5],
-            first_learned=row[6],
-            last_reinforced=row[7],
-        )
+    def _cache_concept(self, key: str, concept: Optional[Concept]) -> None:
+        """Guarda el resultado de una búsqueda por nombre en la caché LRU."""
+        self._concepts[key] = concept
+        if len(self._concepts) > _CONCEPT_CACHE_SIZE:
+            self._concepts.popitem(last=False)
+
+    def _rows_to_concepts(self, rows: Sequence[tuple]) -> list[Concept]:
+        """Convierte filas de SQLite en Concepts, con sus asociaciones.
+
+        Las asociaciones de todas las filas se leen en una sola consulta
+        (por trozos bajo el límite de parámetros).
+        """
+        ids = [row[0] for row in rows]
+        associations: dict[int, list[str]] = {}
+        for start in range(0, len(ids), _MAX_SQL_PARAMS):
+            chunk = ids[start:start + _MAX_SQL_PARAMS]
+            placeholders = ", ".join("?" * len(chunk))
+            for concept_id, associated in self._conn.execute(
+                f"""
+                SELECT concept_id, associated FROM concept_associations
+                WHERE concept_id IN ({placeholders})
+                """,
+                chunk,
+            ):
+                associations.setdefault(concept_id, []).append(associated)
+
+        return [
+            Concept(
+                id=row[0],
+                concept=row[1],
+                definition=row[2] or "",
+                associations=associations.get(row[0], []),
+                confidence=row[4],
+                source_count=row[5],
+                first_learned=row[6],
+                last_reinforced=row[7],
+            )
+            for row in rows
+        ]
+
+    def _migrate_associations(self) -> None:
+        """Pasa a concept_associations las asociaciones guardadas como JSON
+        por versiones anteriores."""
+        pending = self._conn.execute(
+            """
+            SELECT 1 FROM semantic_memory
+            WHERE associations IS NOT NULL AND associations != '[]'
+            LIMIT 1
+            """
+        ).fetchone()
+        if not pending:
+            return
+
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT OR IGNORE INTO concept_associations (concept_id, associated)
+                SELECT s.id, j.value
+                FROM semantic_memory s, json_each(s.associations) j
+                WHERE json_valid(s.associations) AND j.type = 'text'
+                """
+            )
+            self._conn.execute(
+                "UPDATE semantic_memory SET associations = NULL WHERE associations IS NOT NULL"
+            )
@@ -22,6 +22,13 @@ class WorkingMemoryItem:
     output_text: str = ""
     emotion: str = "neutral"
     timestamp: float = field(default_factory=time.time)
+    # Entrada y salida en minúsculas, calculadas una vez para search()
+    _input_lower: str = field(init=False, repr=False, compare=False)
+    _output_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._input_lower = self.input_text.lower()
+        self._output_lower = self.output_text.lower()
 
 
 class WorkingMemory:
@@ -62,12 +69,14 @@ class WorkingMemory:
 
     def search(self, query: str) -> list[WorkingMemoryItem]:
         """Busca en la memoria de trabajo por coincidencia simple."""
+        if not query.strip():
+            return list(self._buffer)
         query_lower = query.lower()
         return [
             item
             for item in self._buffer
-            if query_lower in item.input_text.lower()
-            or query_lower in item.output_text.lower()
+            if query_lower in item._input_lower
+            or query_lower in item._output_lower
         ]
 
     def clear(self) -> None:
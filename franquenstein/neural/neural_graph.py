@@ -18,7 +18,9 @@ import math
 import sqlite3
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
 
 
 # ─── Data structures ──────────────────────────────────────────
@@ -66,6 +68,19 @@ SYNAPTIC_MIN_WEIGHT = 0.02     # Minimum weight (below = pruned)
 INITIAL_SYNAPSE_WEIGHT = 0.1   # Weight for new connections
 FIRE_ENERGY = 1.0               # Energy applied when a node fires directly
 
+_MAX_SQL_PARAMS = 900           # Maximum ids per IN (...) query
+_CSR_MAX_STALE = 256            # Stale source nodes tolerated before a CSR rebuild
+
+# Create a synapse, or reinforce it Hebbian-style if it already exists.
+# Params: src_id, dst_id, initial weight, syn_type, max weight, increment.
+_UPSERT_SYNAPSE_SQL = (
+    "INSERT INTO neural_synapses (src_id, dst_id, weight, syn_type) "
+    "VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(src_id, dst_id) DO UPDATE SET "
+    "    weight = MIN(?, weight + ?), fire_count = fire_count + 1, "
+    "    last_fired = datetime('now')"
+)
+
 
 class NeuralGraph:
     """The neural graph engine.
@@ -83,6 +98,14 @@ class NeuralGraph:
 
     def __init__(self, db_connection: sqlite3.Connection):
         self._conn = db_connection
+        # In-memory CSR copy of the synapses (indptr, dst, weight), built
+        # lazily. Nodes whose outgoing synapses changed since the build
+        # are listed in _csr_stale and read from SQLite instead. Synapse
+        # writes from other connections show up as a synapse_version the
+        # CSR does not account for (see _sync_csr).
+        self._csr: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._csr_stale: set[int] = set()
+        self._csr_version: Optional[int] = None
         self._init_schema()
 
     def _init_schema(self) -> None:
@@ -91,6 +114,43 @@ class NeuralGraph:
         if schema_path.exists():
             with open(schema_path, "r", encoding="utf-8") as f:
                 self._conn.executescript(f.read())
+            self._backfill_degrees()
+            self._backfill_stats()
+
+    def _backfill_degrees(self) -> None:
+        """Fill neural_node_degree for graphs created before it existed."""
+        missing = self._conn.execute(
+            "SELECT EXISTS (SELECT 1 FROM neural_synapses) "
+            "AND NOT EXISTS (SELECT 1 FROM neural_node_degree)"
+        ).fetchone()[0]
+        if not missing:
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO neural_node_degree (node_id, degree) "
+                "SELECT node_id, COUNT(*) FROM ("
+                "    SELECT src_id AS node_id FROM neural_synapses "
+                "    UNION ALL SELECT dst_id FROM neural_synapses"
+                ") GROUP BY node_id"
+            )
+
+    def _backfill_stats(self) -> None:
+        """Seed neural_stats from the graph on first use."""
+        if self._conn.execute(
+            "SELECT 1 FROM neural_stats WHERE key = 'node_count'"
+        ).fetchone():
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO neural_stats (key, value) "
+                "SELECT 'node_count', COUNT(*) FROM neural_nodes "
+                "UNION ALL SELECT 'synapse_count', COUNT(*) FROM neural_synapses "
+                "UNION ALL SELECT 'synapse_weight_sum', COALESCE(SUM(weight), 0) FROM neural_synapses"
+            )
+
+    def _stats(self) -> dict[str, float]:
+        """Trigger-maintained running totals (see neural_stats)."""
+        return dict(self._conn.execute("SELECT key, value FROM neural_stats").fetchall())
 
     # ─── Node management ──────────────────────────────────────
 
@@ -135,10 +195,23 @@ class NeuralGraph:
             energy=row[3], resting=row[4], fire_count=row[5],
         )
 
+    def intern_many(self, labels: Iterable[str], node_type: str = "concept") -> list[int]:
+        """Get or create nodes for many labels in one transaction.
+
+        Returns the node ids in label order (duplicates collapsed).
+        """
+        clean = list(dict.fromkeys(
+            label.lower().strip() for label in labels if label.strip()
+        ))
+        if not clean:
+            return []
+        with self._conn:
+            ids = self._node_ids(set(clean), node_type)
+        return [ids[label] for label in clean]
+
     def node_count(self) -> int:
         """Total number of nodes in the graph."""
-        row = self._conn.execute("SELECT COUNT(*) FROM neural_nodes").fetchone()
-        return row[0] if row else 0
+        return int(self._stats().get("node_count", 0))
 
     # ─── Synapse management ───────────────────────────────────
 
@@ -161,48 +234,84 @@ class NeuralGraph:
         if src.id == dst.id:
             raise ValueError("Cannot connect a node to itself")
 
-        existing = self._conn.execute(
-            "SELECT id, weight, fire_count FROM neural_synapses "
-            "WHERE src_id = ? AND dst_id = ?",
-            (src.id, dst.id),
+        row = self._conn.execute(
+            _UPSERT_SYNAPSE_SQL + " RETURNING id, weight, fire_count",
+            (
+                src.id, dst.id, weight, syn_type,
+                HEBBIAN_MAX_WEIGHT, HEBBIAN_INCREMENT * plasticity,
+            ),
         ).fetchone()
+        self._mark_stale((src.id,), writes=1)
+        self._conn.commit()
+        return Synapse(
+            id=row[0], src_id=src.id, dst_id=dst.id,
+            weight=row[1], syn_type=syn_type, fire_count=row[2],
+        )
 
-        if existing:
-            new_weight = min(
-                HEBBIAN_MAX_WEIGHT,
-                existing[1] + (HEBBIAN_INCREMENT * plasticity),
-            )
-            self._conn.execute(
-                "UPDATE neural_synapses "
-                "SET weight = ?, fire_count = fire_count + 1, "
-                "    last_fired = datetime('now') "
-                "WHERE id = ?",
-                (new_weight, existing[0]),
-            )
-            self._conn.commit()
-            return Synapse(
-                id=existing[0], src_id=src.id, dst_id=dst.id,
-                weight=new_weight, syn_type=syn_type,
-                fire_count=existing[2] + 1,
+    def connect_many(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        syn_type: str = "association",
+        plasticity: float = 1.0,
+    ) -> int:
+        """Create or strengthen many connections in a single transaction.
+
+        Same semantics as connect() for each pair, but duplicate pairs
+        are collapsed and self-connections are skipped instead of raising.
+
+        Returns the number of synapses created or strengthened.
+        """
+        unique_pairs = {
+            (src.lower().strip(), dst.lower().strip()) for src, dst in pairs
+        }
+        unique_pairs = {(s, d) for s, d in unique_pairs if s and d and s != d}
+        if not unique_pairs:
+            return 0
+
+        increment = HEBBIAN_INCREMENT * plasticity
+        with self._conn:
+            ids = self._node_ids({label for pair in unique_pairs for label in pair})
+            self._conn.executemany(
+                _UPSERT_SYNAPSE_SQL,
+                [
+                    (ids[s], ids[d], INITIAL_SYNAPSE_WEIGHT, syn_type,
+                     HEBBIAN_MAX_WEIGHT, increment)
+                    for s, d in unique_pairs
+                ],
             )
+            self._mark_stale((ids[s] for s, _ in unique_pairs), writes=len(unique_pairs))
+        return len(unique_pairs)
 
-        cursor = self._conn.execute(
-            "INSERT INTO neural_synapses (src_id, dst_id, weight, syn_type) "
-            "VALUES (?, ?, ?, ?)",
-            (src.id, dst.id, weight, syn_type),
-        )
-        self._conn.commit()
-        return Synapse(
-            id=cursor.lastrowid, src_id=src.id, dst_id=dst.id,
-            weight=weight, syn_type=syn_type, fire_count=0,
+    def _node_ids(self, labels: set[str], node_type: str = "concept") -> dict[str, int]:
+        """Resolve (creating if needed) node ids for already-clean labels.
+
+        Does not commit — callers wrap it in their own transaction.
+        """
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO neural_nodes (label, node_type) VALUES (?, ?)",
+            [(label, node_type) for label in labels],
         )
+        placeholders = ",".join("?" * len(labels))
+        rows = self._conn.execute(
+            f"SELECT label, id FROM neural_nodes WHERE label IN ({placeholders})",
+            tuple(labels),
+        ).fetchall()
+        return dict(rows)
+
+    def _labels_for(self, node_ids: Sequence[int]) -> list[str]:
+        """Labels of the given node ids, in the same order."""
+        if not node_ids:
+            return []
+        placeholders = ",".join("?" * len(node_ids))
+        labels = dict(self._conn.execute(
+            f"SELECT id, label FROM neural_nodes WHERE id IN ({placeholders})",
+            tuple(node_ids),
+        ).fetchall())
+        return [labels[i] for i in node_ids if i in labels]
 
     def synapse_count(self) -> int:
         """Total number of synapses in the graph."""
-        row = self._conn.execute(
-            "SELECT COUNT(*) FROM neural_synapses"
-        ).fetchone()
-        return row[0] if row else 0
+        return int(self._stats().get("synapse_count", 0))
 
     def get_outgoing(self, node_id: int) -> list[tuple[int, float, str]]:
         """Get all outgoing synapses from a node.
@@ -219,6 +328,118 @@ class NeuralGraph:
         ).fetchall()
         return [(r[0], r[1], r[2]) for r in rows]
 
+    def _outgoing_many(self, node_ids: set[int]) -> dict[int, list[tuple[int, float]]]:
+        """Outgoing synapses of many nodes, as get_outgoing() orders them.
+
+        Returns {src_id: [(dst_id, weight), ...]} for nodes that have any.
+        """
+        outgoing: dict[int, list[tuple[int, float]]] = {}
+        ids = list(node_ids)
+        for start in range(0, len(ids), _MAX_SQL_PARAMS):
+            chunk = ids[start:start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            for src_id, dst_id, weight in self._conn.execute(
+                "SELECT src_id, dst_id, weight FROM neural_synapses "
+                f"WHERE src_id IN ({placeholders}) AND weight >= ? "
+                "ORDER BY src_id, weight DESC",
+                (*chunk, SYNAPTIC_MIN_WEIGHT),
+            ):
+                outgoing.setdefault(src_id, []).append((dst_id, weight))
+        return outgoing
+
+    def _gather_outgoing(
+        self, node_ids: Sequence[int]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Outgoing synapses of node_ids, concatenated in that order.
+
+        Returns (lens, dst, weight): lens[i] synapses belong to node_ids[i],
+        each node's in get_outgoing() order. Served from the in-memory CSR;
+        nodes changed since it was built are read from SQLite.
+        """
+        if self._csr is None:
+            self._build_csr()
+        indptr, dst, weight = self._csr
+        stale_ids = self._csr_stale.intersection(node_ids)
+        stale = self._outgoing_many(stale_ids) if stale_ids else {}
+
+        lens: list[int] = []
+        dst_parts: list[np.ndarray] = []
+        weight_parts: list[np.ndarray] = []
+        for node_id in node_ids:
+            if node_id in stale_ids:
+                edges = stale.get(node_id, [])
+                lens.append(len(edges))
+                dst_parts.append(np.array([e[0] for e in edges], dtype=np.int64))
+                weight_parts.append(np.array([e[1] for e in edges], dtype=np.float64))
+            elif node_id + 1 < len(indptr):
+                start, end = indptr[node_id], indptr[node_id + 1]
+                lens.append(end - start)
+                dst_parts.append(dst[start:end])
+                weight_parts.append(weight[start:end])
+            else:
+                lens.append(0)  # Created after the CSR build, no synapses yet
+
+        if not dst_parts:
+            return np.zeros(len(lens), dtype=np.int64), dst[:0], weight[:0]
+        return (
+            np.array(lens, dtype=np.int64),
+            np.concatenate(dst_parts),
+            np.concatenate(weight_parts),
+        )
+
+    def _build_csr(self) -> None:
+        """Load all live synapses into CSR arrays, ordered like get_outgoing()."""
+        rows = self._conn.execute(
+            "SELECT src_id, dst_id, weight FROM neural_synapses "
+            "WHERE weight >= ? ORDER BY src_id, weight DESC",
+            (SYNAPTIC_MIN_WEIGHT,),
+        ).fetchall()
+        edges = np.array(rows, dtype=[("src", np.int64), ("dst", np.int64), ("weight", np.float64)])
+        max_id = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM neural_nodes").fetchone()[0]
+
+        indptr = np.zeros(max_id + 2, dtype=np.int64)
+        np.cumsum(np.bincount(edges["src"], minlength=max_id + 1), out=indptr[1:])
+        self._csr = (indptr, edges["dst"].copy(), edges["weight"].copy())
+        self._csr_stale.clear()
+
+    def _mark_stale(self, src_ids: Iterable[int], writes: int) -> None:
+        """Note nodes whose outgoing synapses this graph just changed.
+
+        Call inside the writing transaction, with the number of synapse
+        rows written. If synapse_version moved by exactly that much, the
+        CSR is still current apart from src_ids; otherwise another
+        connection wrote synapses as well and the CSR is dropped.
+        """
+        if self._csr is None:
+            return
+        version = self._synapse_version()
+        if version - writes != self._csr_version:
+            self._csr = None
+            return
+        self._csr_version = version
+        self._csr_stale.update(src_ids)
+        if len(self._csr_stale) > _CSR_MAX_STALE:
+            self._csr = None
+
+    def _sync_csr(self) -> None:
+        """Drop the CSR if synapses changed behind this graph's back.
+
+        Another NeuralGraph on the same database (e.g. the InnerWorld
+        thread) writes synapses this instance never gets to mark stale.
+        Commits that touch no synapses leave synapse_version alone.
+        """
+        version = self._synapse_version()
+        if version != self._csr_version:
+            self._csr = None
+            self._csr_version = version
+
+    def _synapse_version(self) -> int:
+        """Trigger-maintained count of synapse writes (see neural_stats)."""
+        row = self._conn.execute(
+            "SELECT value FROM neural_stats WHERE key = 'synapse_version'"
+        ).fetchone()
+        return int(row[0]) if row else 0
+
     # ─── Spreading Activation ─────────────────────────────────
 
     def activate(
@@ -238,48 +459,53 @@ class NeuralGraph:
         Like a brain: "dog" → fires "animal" (strong) → fires "alive" (medium)
         → fires "needs food" (weak).
         """
-        params = params or {}
-        activation_threshold = float(params.get("activation_threshold", ACTIVATION_THRESHOLD))
-        decay_factor = float(params.get("decay_factor", DECAY_FACTOR))
-        max_propagation_depth = int(params.get("max_propagation_depth", MAX_PROPAGATION_DEPTH))
-
-        # Reset all activation energy
-        self._conn.execute("UPDATE neural_nodes SET energy = resting")
-
-        # Fire input nodes
-        fired: dict[int, float] = {}
-        seed_nodes: list[Node] = []
-
+        node_ids = []
         for label in labels:
             node = self.get_node(label)
             if node:
-                fired[node.id] = initial_energy
-                node.energy = initial_energy
-                seed_nodes.append(node)
-                self._conn.execute(
-                    "UPDATE neural_nodes "
-                    "SET energy = ?, fire_count = fire_count + 1, "
-                    "    last_fired = datetime('now') "
-                    "WHERE id = ?",
-                    (initial_energy, node.id),
-                )
-
-        # Propagate through the graph (BFS with decay)
-        frontier = [(n.id, initial_energy, 0) for n in seed_nodes]
-
-        while frontier:
-            current_id, current_energy, depth = frontier.pop(0)
-
-            if depth >= max_propagation_depth:
-                continue
+                node_ids.append(node.id)
+        return self.activate_ids(
+            node_ids, initial_energy, params, trigger=", ".join(labels)
+        )
 
-            outgoing = self.get_outgoing(current_id)
-            for dst_id, weight, _label in outgoing:
-                propagated_energy = current_energy * weight * decay_factor
+    def activate_ids(
+        self,
+        node_ids: Sequence[int],
+        initial_energy: float = FIRE_ENERGY,
+        params: Optional[dict] = None,
+        trigger: Optional[str] = None,
+    ) -> ActivationResult:
+        """Same as activate(), but fires nodes already resolved to ids.
 
-                if propagated_energy < activation_threshold:
-                    continue
+        Callers that interned their labels earlier in the cycle (see
+        intern_many) skip the per-label lookups entirely.
+        """
+        params = params or {}
+        activation_threshold = float(params.get("activation_threshold", ACTIVATION_THRESHOLD))
+        decay_factor = float(params.get("decay_factor", DECAY_FACTOR))
+        max_propagation_depth = int(params.get("max_propagation_depth", MAX_PROPAGATION_DEPTH))
 
+        # Fire input nodes
+        seeds = list(dict.fromkeys(node_ids))
+        fired: dict[int, float] = dict.fromkeys(seeds, initial_energy)
+
+        # Propagate through the graph (BFS with decay), one level at a
+        # time: all of a level's synapses are gathered and scored with
+        # NumPy, and only the hits above threshold are accumulated in
+        # order. Energies are written once the cascade is done.
+        level_ids = seeds
+        level_energy = [initial_energy] * len(seeds)
+        self._sync_csr()
+
+        for _depth in range(max_propagation_depth):
+            if not level_ids:
+                break
+            lens, dst_ids, weights = self._gather_outgoing(level_ids)
+            propagated = np.repeat(np.asarray(level_energy, dtype=np.float64), lens) * weights * decay_factor
+            hits = np.flatnonzero(propagated >= activation_threshold)
+
+            level_ids, level_energy = [], []
+            for dst_id, propagated_energy in zip(dst_ids[hits].tolist(), propagated[hits].tolist()):
                 # Accumulate energy (nodes can be activated from multiple paths)
                 existing_energy = fired.get(dst_id, 0.0)
                 # Use soft-max: don't just add, use logistic-like curve
@@ -287,15 +513,42 @@ class NeuralGraph:
 
                 if new_energy > existing_energy:
                     fired[dst_id] = new_energy
-                    self._conn.execute(
-                        "UPDATE neural_nodes SET energy = ? WHERE id = ?",
-                        (new_energy, dst_id),
-                    )
-                    frontier.append((dst_id, new_energy, depth + 1))
+                    level_ids.append(dst_id)
+                    level_energy.append(new_energy)
 
-        self._conn.commit()
+        with self._conn:
+            self._write_energies(seeds, fired)
+            result = self._activation_result(seeds, fired, activation_threshold, trigger)
+        return result
 
-        # Build result
+    def _write_energies(self, seeds: list[int], fired: dict[int, float]) -> None:
+        """Reset the previous activation and store this one (no commit)."""
+        # Reset activation energy. Table-wide, since another graph on the
+        # same database may have energized nodes too; idx_nodes_excited
+        # keeps it to the nodes actually above resting.
+        self._conn.execute(
+            "UPDATE neural_nodes SET energy = resting WHERE energy != resting"
+        )
+
+        self._conn.executemany(
+            "UPDATE neural_nodes "
+            "SET fire_count = fire_count + 1, last_fired = datetime('now') "
+            "WHERE id = ?",
+            [(node_id,) for node_id in seeds],
+        )
+        self._conn.executemany(
+            "UPDATE neural_nodes SET energy = ? WHERE id = ?",
+            [(energy, node_id) for node_id, energy in fired.items()],
+        )
+
+    def _activation_result(
+        self,
+        seeds: list[int],
+        fired: dict[int, float],
+        activation_threshold: float,
+        trigger: Optional[str],
+    ) -> ActivationResult:
+        """Collect the activated nodes and log the cascade (no commit)."""
         result = ActivationResult()
         if fired:
             activated_rows = self._conn.execute(
@@ -322,13 +575,12 @@ class NeuralGraph:
                 "INSERT INTO activation_log (trigger, nodes_fired, peak_node, peak_energy) "
                 "VALUES (?, ?, ?, ?)",
                 (
-                    ", ".join(labels),
+                    trigger if trigger is not None else ", ".join(self._labels_for(seeds)),
                     result.total_fired,
                     result.peak_node.label if result.peak_node else None,
                     result.peak_energy,
                 ),
             )
-            self._conn.commit()
 
         return result
 
@@ -345,19 +597,37 @@ class NeuralGraph:
 
         Returns the number of synapses created or strengthened.
         """
-        clean_labels = list(set(label.lower().strip() for label in labels if label.strip()))
+        clean_labels = set(label.lower().strip() for label in labels if label.strip())
         if len(clean_labels) < 2:
             return 0
 
-        synapse_count = 0
-        for i, src in enumerate(clean_labels):
-            for dst in clean_labels[i + 1:]:
-                # Bidirectional: A→B and B→A
-                self.connect(src, dst, syn_type=syn_type, plasticity=plasticity)
-                self.connect(dst, src, syn_type=syn_type, plasticity=plasticity)
-                synapse_count += 2
+        with self._conn:
+            ids = self._node_ids(clean_labels)
+            return self._hebbian_upsert(list(ids.values()), syn_type, plasticity)
 
-        return synapse_count
+    def hebbian_learn_ids(
+        self,
+        node_ids: Sequence[int],
+        syn_type: str = "association",
+        plasticity: float = 1.0,
+    ) -> int:
+        """Same as hebbian_learn(), for nodes already resolved to ids."""
+        unique_ids = list(dict.fromkeys(node_ids))
+        if len(unique_ids) < 2:
+            return 0
+        with self._conn:
+            return self._hebbian_upsert(unique_ids, syn_type, plasticity)
+
+    def _hebbian_upsert(self, ids: list[int], syn_type: str, plasticity: float) -> int:
+        """Upsert both directions of every pair of distinct ids (no commit)."""
+        increment = HEBBIAN_INCREMENT * plasticity
+        rows = [
+            (src, dst, INITIAL_SYNAPSE_WEIGHT, syn_type, HEBBIAN_MAX_WEIGHT, increment)
+            for src in ids for dst in ids if src != dst
+        ]
+        self._conn.executemany(_UPSERT_SYNAPSE_SQL, rows)
+        self._mark_stale(ids, writes=len(rows))
+        return len(rows)
 
     def learn_association(
         self,
@@ -377,25 +647,14 @@ class NeuralGraph:
         if src.id == dst.id:
             return
 
-        existing = self._conn.execute(
-            "SELECT id, weight FROM neural_synapses "
-            "WHERE src_id = ? AND dst_id = ?",
-            (src.id, dst.id),
-        ).fetchone()
-
-        if existing:
-            new_weight = min(HEBBIAN_MAX_WEIGHT, existing[1] + strength * 0.5)
-            self._conn.execute(
-                "UPDATE neural_synapses SET weight = ?, last_fired = datetime('now') "
-                "WHERE id = ?",
-                (new_weight, existing[0]),
-            )
-        else:
-            self._conn.execute(
-                "INSERT INTO neural_synapses (src_id, dst_id, weight, syn_type) "
-                "VALUES (?, ?, ?, ?)",
-                (src.id, dst.id, strength, syn_type),
-            )
+        self._conn.execute(
+            "INSERT INTO neural_synapses (src_id, dst_id, weight, syn_type) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(src_id, dst_id) DO UPDATE SET "
+            "    weight = MIN(?, weight + ?), last_fired = datetime('now')",
+            (src.id, dst.id, strength, syn_type, HEBBIAN_MAX_WEIGHT, strength * 0.5),
+        )
+        self._mark_stale((src.id,), writes=1)
         self._conn.commit()
 
     # ─── Synaptic Decay ───────────────────────────────────────
@@ -429,6 +688,7 @@ class NeuralGraph:
         ).rowcount
 
         self._conn.commit()
+        self._csr = None  # Every weight changed
 
         return {
             "synapses_pruned": pruned,
@@ -440,11 +700,11 @@ class NeuralGraph:
     def get_most_connected(self, limit: int = 10) -> list[tuple[str, int]]:
         """Get the most connected nodes (highest degree)."""
         rows = self._conn.execute(
-            "SELECT n.label, "
-            "  (SELECT COUNT(*) FROM neural_synapses WHERE src_id = n.id) + "
-            "  (SELECT COUNT(*) FROM neural_synapses WHERE dst_id = n.id) AS degree "
-            "FROM neural_nodes n "
-            "ORDER BY degree DESC LIMIT ?",
+            "SELECT n.label, d.degree "
+            "FROM neural_node_degree d "
+            "JOIN neural_nodes n ON n.id = d.node_id "
+            "WHERE d.degree > 0 "
+            "ORDER BY d.degree DESC LIMIT ?",
             (limit,),
         ).fetchall()
         return [(r[0], r[1]) for r in rows]
@@ -482,13 +742,10 @@ class NeuralGraph:
 
     def get_stats(self) -> dict:
         """Get graph statistics for display."""
-        nodes = self.node_count()
-        synapses = self.synapse_count()
-
-        avg_weight_row = self._conn.execute(
-            "SELECT AVG(weight) FROM neural_synapses"
-        ).fetchone()
-        avg_weight = round(avg_weight_row[0], 3) if avg_weight_row and avg_weight_row[0] else 0.0
+        stats = self._stats()
+        nodes = int(stats.get("node_count", 0))
+        synapses = int(stats.get("synapse_count", 0))
+        avg_weight = round(stats.get("synapse_weight_sum", 0.0) / synapses, 3) if synapses else 0.0
 
         most_fired_row = self._conn.execute(
             "SELECT label, fire_count FROM neural_nodes "
@@ -13,12 +13,37 @@ The hierarchy:
 from __future__ import annotations
 
 import random
+import re
 from typing import Optional
 
 from franquenstein.neural.neural_graph import ActivationResult, Node
 
 _NOISE_WORDS = {"paso", "gusta", "sobre", "algo", "relación", "relacion", "base", "conecta"}
 
+# ─── Input classifier vocabularies ───────────────────────────
+# Built once at import; weave() runs all three tests on every input.
+
+_GREETINGS = frozenset({
+    "hola", "hello", "hey", "hi", "buenas", "buenos días",
+    "buenas tardes", "buenas noches", "qué tal", "como estas",
+    "que tal", "saludos",
+})
+
+
+def _marker_re(markers: list[str]) -> re.Pattern:
+    """One alternation matching any marker as a plain substring."""
+    return re.compile("|".join(map(re.escape, markers)))
+
+
+_IDENTITY_RE = _marker_re([
+    "quien eres", "quién eres", "como te llamas", "cómo te llamas",
+    "tu nombre", "what is your name", "who are you",
+])
+_REFLECTION_RE = _marker_re([
+    "que sabes", "qué sabes", "que has aprendido", "qué has aprendido",
+    "reflecciona", "reflexiona", "piensa en ti",
+])
+
 
 # ─── Response templates ──────────────────────────────────────
 
@@ -57,6 +82,14 @@ _TEMPLATES = {
     ],
 }
 
+# Tone-specific lead-ins prepended to a composed response
+_TONE_PREFIXES = {
+    "warm": ("Me gusta esta conexión: ", "Suena bien así: "),
+    "focused": ("Punto clave: ", "En concreto: "),
+    "defensive": ("Con cautela: ", "Voy paso a paso: "),
+    "reflective": ("Si lo miro con calma: ", "Pensándolo bien: "),
+}
+
 
 class ResponseWeaver:
     """Weave responses from neural graph activation patterns.
@@ -67,6 +100,7 @@ class ResponseWeaver:
 
     def __init__(self, neural_graph):
         self.graph = neural_graph
+        self._rng = random.Random()
 
     def weave(
         self,
@@ -123,33 +157,16 @@ class ResponseWeaver:
         if not response:
             return None
 
-        if tone == "warm":
-            return random.choice([
-                f"Me gusta esta conexión: {response}",
-                f"Suena bien así: {response}",
-            ])
-        if tone == "focused":
-            return random.choice([
-                f"Punto clave: {response}",
-                f"En concreto: {response}",
-            ])
-        if tone == "defensive":
-            return random.choice([
-                f"Con cautela: {response}",
-                f"Voy paso a paso: {response}",
-            ])
-        if tone == "reflective":
-            return random.choice([
-                f"Si lo miro con calma: {response}",
-                f"Pensándolo bien: {response}",
-            ])
+        prefixes = _TONE_PREFIXES.get(tone)
+        if prefixes:
+            return self._rng.choice(prefixes) + response
         return response
 
     # ─── Response generators ──────────────────────────────────
 
     def _greeting_response(self, stats: Optional[dict]) -> str:
         stats = stats or self.graph.get_stats()
-        template = random.choice(_TEMPLATES["greeting"])
+        template = self._rng.choice(_TEMPLATES["greeting"])
         return template.format(
             nodes=stats.get("total_nodes", 0),
             synapses=stats.get("total_synapses", 0),
@@ -157,7 +174,7 @@ class ResponseWeaver:
 
     def _identity_response(self, stats: Optional[dict]) -> str:
         stats = stats or self.graph.get_stats()
-        template = random.choice(_TEMPLATES["identity"])
+        template = self._rng.choice(_TEMPLATES["identity"])
         return template.format(
             nodes=stats.get("total_nodes", 0),
             synapses=stats.get("total_synapses", 0),
@@ -167,7 +184,7 @@ class ResponseWeaver:
         stats = self.graph.get_stats()
         top = stats.get("most_fired_node", "algo")
         count = stats.get("most_fired_count", 0)
-        template = random.choice(_TEMPLATES["reflection"])
+        template = self._rng.choice(_TEMPLATES["reflection"])
         return template.format(top=top, count=count)
 
     def _association_response(self, nodes: list[Node]) -> str:
@@ -181,11 +198,11 @@ class ResponseWeaver:
         connection_labels = [c[0] for c in connections]
 
         if b.label in connection_labels:
-            template = random.choice(_TEMPLATES["association"])
+            template = self._rng.choice(_TEMPLATES["association"])
             return template.format(a=a.label, b=b.label)
 
         # They're both active but not directly connected — curiosity!
-        template = random.choice(_TEMPLATES["curiosity"])
+        template = self._rng.choice(_TEMPLATES["curiosity"])
         return template.format(concept=a.label, related=b.label)
 
     def _single_concept_response(self, node: Node) -> str:
@@ -197,10 +214,10 @@ class ResponseWeaver:
             if not detail_parts:
                 detail_parts = [c[0] for c in connections[:2]]
             detail = f"Está conectado con {', '.join(detail_parts)}."
-            template = random.choice(_TEMPLATES["explanation"])
+            template = self._rng.choice(_TEMPLATES["explanation"])
             return template.format(concept=node.label, detail=detail)
 
-        template = random.choice(_TEMPLATES["uncertainty"])
+        template = self._rng.choice(_TEMPLATES["uncertainty"])
         return template.format(concept=node.label)
 
 
@@ -225,20 +242,13 @@ class ResponseWeaver:
 
     @staticmethod
     def _is_greeting(text: str) -> bool:
-        greetings = {"hola", "hello", "hey", "hi", "buenas", "buenos días",
-                     "buenas tardes", "buenas noches", "qué tal", "como estas",
-                     "que tal", "saludos"}
-        words = set(text.replace("!", "").replace("¿", "").replace("?", "").split())
-        return bool(words & greetings)
+        words = text.replace("!", "").replace("¿", "").replace("?", "").split()
+        return not _GREETINGS.isdisjoint(words)
 
     @staticmethod
     def _is_identity_question(text: str) -> bool:
-        markers = ["quien eres", "quién eres", "como te llamas", "cómo te llamas",
-                    "tu nombre", "what is your name", "who are you"]
-        return any(m in text for m in markers)
+        return _IDENTITY_RE.search(text) is not None
 
     @staticmethod
     def _is_reflection_request(text: str) -> bool:
-        markers = ["que sabes", "qué sabes", "que has aprendido", "qué has aprendido",
-                    "reflecciona", "reflexiona", "piensa en ti"]
-        return any(m in text for m in markers)
+        return _REFLECTION_RE.search(text) is not None
@@ -28,6 +28,72 @@ CREATE TABLE IF NOT EXISTS neural_synapses (
     UNIQUE(src_id, dst_id)
 );
 
+-- Degree (incoming + outgoing synapses) of each connected node, kept
+-- up to date by the triggers below so it never has to be counted.
+CREATE TABLE IF NOT EXISTS neural_node_degree (
+    node_id     INTEGER PRIMARY KEY,             -- neural_nodes.id
+    degree      INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_synapse_degree_insert AFTER INSERT ON neural_synapses
+BEGIN
+    INSERT INTO neural_node_degree (node_id, degree)
+    VALUES (NEW.src_id, 1), (NEW.dst_id, 1)
+    ON CONFLICT(node_id) DO UPDATE SET degree = degree + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_synapse_degree_delete AFTER DELETE ON neural_synapses
+BEGIN
+    UPDATE neural_node_degree SET degree = degree - 1
+    WHERE node_id IN (OLD.src_id, OLD.dst_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_node_degree_delete AFTER DELETE ON neural_nodes
+BEGIN
+    DELETE FROM neural_node_degree WHERE node_id = OLD.id;
+END;
+
+-- Running totals for get_stats(), kept up to date by the triggers below
+-- so reading them never scans the graph. synapse_version grows with every
+-- synapse write and tells NeuralGraph when its in-memory copy is outdated.
+CREATE TABLE IF NOT EXISTS neural_stats (
+    key         TEXT    PRIMARY KEY,             -- node_count | synapse_count | synapse_weight_sum | synapse_version
+    value       REAL    NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+INSERT OR IGNORE INTO neural_stats (key, value) VALUES ('synapse_version', 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_node_stats_insert AFTER INSERT ON neural_nodes
+BEGIN
+    UPDATE neural_stats SET value = value + 1 WHERE key = 'node_count';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_node_stats_delete AFTER DELETE ON neural_nodes
+BEGIN
+    UPDATE neural_stats SET value = value - 1 WHERE key = 'node_count';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_synapse_totals_insert AFTER INSERT ON neural_synapses
+BEGIN
+    UPDATE neural_stats SET value = value + 1 WHERE key = 'synapse_count';
+    UPDATE neural_stats SET value = value + NEW.weight WHERE key = 'synapse_weight_sum';
+    UPDATE neural_stats SET value = value + 1 WHERE key = 'synapse_version';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_synapse_totals_update AFTER UPDATE OF weight ON neural_synapses
+BEGIN
+    UPDATE neural_stats SET value = value + NEW.weight - OLD.weight
+    WHERE key = 'synapse_weight_sum';
+    UPDATE neural_stats SET value = value + 1 WHERE key = 'synapse_version';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_synapse_totals_delete AFTER DELETE ON neural_synapses
+BEGIN
+    UPDATE neural_stats SET value = value - 1 WHERE key = 'synapse_count';
+    UPDATE neural_stats SET value = value - OLD.weight WHERE key = 'synapse_weight_sum';
+    UPDATE neural_stats SET value = value + 1 WHERE key = 'synapse_version';
+END;
+
 CREATE TABLE IF NOT EXISTS activation_log (
     id          INTEGER PRIMARY KEY AUTOINCREMENT,
     timestamp   TEXT    NOT NULL DEFAULT (datetime('now')),
@@ -40,6 +106,18 @@ CREATE TABLE IF NOT EXISTS activation_log (
 CREATE INDEX IF NOT EXISTS idx_nodes_label    ON neural_nodes(label);
 CREATE INDEX IF NOT EXISTS idx_nodes_type     ON neural_nodes(node_type);
 CREATE INDEX IF NOT EXISTS idx_nodes_energy   ON neural_nodes(energy DESC);
-CREATE INDEX IF NOT EXISTS idx_syn_src        ON neural_synapses(src_id);
+CREATE INDEX IF NOT EXISTS idx_nodes_fire     ON neural_nodes(fire_count DESC);
+-- Nodes away from resting energy: the activation reset only visits these
+CREATE INDEX IF NOT EXISTS idx_nodes_excited  ON neural_nodes(id) WHERE energy != resting;
+CREATE INDEX IF NOT EXISTS idx_syn_src_weight ON neural_synapses(src_id, weight DESC, dst_id);
 CREATE INDEX IF NOT EXISTS idx_syn_dst        ON neural_synapses(dst_id);
 CREATE INDEX IF NOT EXISTS idx_syn_weight     ON neural_synapses(weight DESC);
+CREATE INDEX IF NOT EXISTS idx_degree         ON neural_node_degree(degree DESC);
+
+-- Superseded by idx_syn_src_weight
+DROP INDEX IF EXISTS idx_syn_src;
+
+-- Superseded by trg_synapse_totals_* (which also bump synapse_version)
+DROP TRIGGER IF EXISTS trg_synapse_stats_insert;
+DROP TRIGGER IF EXISTS trg_synapse_stats_update;
+DROP TRIGGER IF EXISTS trg_synapse_stats_delete;
@@ -1,5 +1,6 @@
 """Reasoning modules for Franquenstein."""
 
 from .llm import LocalLLMReasoner
+from .response_cache import ResponseCache
 
-__all__ = ["LocalLLMReasoner"]
+__all__ = ["LocalLLMReasoner", "ResponseCache"]
@@ -10,7 +10,7 @@ from __future__ import annotations
 import json
 import urllib.error
 import urllib.request
-from typing import Any
+from typing import Any, Sequence
 
 
 class LocalLLMReasoner:
@@ -42,7 +42,7 @@ class LocalLLMReasoner:
         level_name: str,
         mood: str,
         working_memory: list[dict[str, Any]],
-        known_concepts: list[str],
+        known_concepts: Sequence[str],
         good_examples: list[dict[str, str]] | None = None,
         user_name: str = "",
     ) -> str:
@@ -0,0 +1,159 @@
+"""Semantic response cache for the local LLM path.
+
+Generating with the local model takes seconds, while users often repeat
+or rephrase the same question. This cache remembers previous LLM answers
+per mood and user, and serves them again when a new input is an exact
+repeat, or a rephrasing with the same content words that is close enough
+in a hashed bag-of-words embedding space.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from typing import Optional
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Words a rephrasing may add, drop or reorder without changing the question.
+# Negations are deliberately absent: "is it safe" != "is it not safe".
+_FILLER_WORDS = frozenset({
+    "el", "la", "los", "las", "un", "una", "de", "del", "al", "en", "y", "o",
+    "a", "que", "qué", "es", "son", "se", "me", "te", "por", "con", "para",
+    "the", "an", "is", "are", "was", "were", "in", "on", "at", "to",
+    "for", "of", "and", "or", "it", "do", "does", "please",
+})
+
+# (mood, user, normalized text)
+_Key = tuple[str, str, str]
+# (mood, user, content words)
+_ContentKey = tuple[str, str, frozenset[str]]
+
+
+class ResponseCache:
+    """Two-tier (exact + same-content cosine) LRU cache of generated responses."""
+
+    def __init__(self, capacity: int = 512, dim: int = 128, threshold: float = 0.88):
+        self.capacity = capacity
+        self.dim = dim
+        self.threshold = threshold
+
+        self._vecs = np.zeros((capacity, dim), dtype=np.float32)
+        self._last_used = np.zeros(capacity, dtype=np.int64)
+        self._responses: list[str] = [""] * capacity
+        self._keys: list[Optional[tuple[_Key, _ContentKey]]] = [None] * capacity
+
+        self._exact: dict[_Key, int] = {}
+        self._by_content: dict[_ContentKey, int] = {}
+        self._size = 0
+        self._clock = 0
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def get(self, text: str, mood: str, user: str = "") -> Optional[str]:
+        """Return a cached response for text under mood and user, or None."""
+        slot = self._lookup(text, mood, user)
+        if slot is None:
+            return None
+        self._touch(slot)
+        return self._responses[slot]
+
+    def put(self, text: str, mood: str, response: str, user: str = "") -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        normalized = self._normalize(text)
+        vec = self._embed(normalized)
+        if vec is None or not response:
+            return
+
+        key = (mood, user, normalized)
+        content_key = (mood, user, self._content_words(normalized))
+        slot = self._exact.get(key)
+        if slot is None:
+            if self._size < self.capacity:
+                slot = self._size
+                self._size += 1
+            else:
+                slot = int(np.argmin(self._last_used[:self._size]))
+                self._forget(slot)
+            self._exact[key] = slot
+            self._keys[slot] = (key, content_key)
+        self._by_content[content_key] = slot
+
+        self._vecs[slot] = vec
+        self._responses[slot] = response
+        self._touch(slot)
+
+    def discard(self, text: str, mood: str, user: str = "", response: Optional[str] = None) -> bool:
+        """Drop the entry get() would serve for text, e.g. after negative feedback.
+
+        With response given, the entry is only dropped if it holds that
+        response. Returns True if an entry was dropped.
+        """
+        slot = self._lookup(text, mood, user)
+        if slot is None or (response is not None and self._responses[slot] != response):
+            return False
+        self._forget(slot)
+        self._last_used[slot] = 0  # Reused first once the cache is full
+        return True
+
+    def clear(self) -> None:
+        self._exact.clear()
+        self._by_content.clear()
+        self._keys = [None] * self.capacity
+        self._size = 0
+
+    # ─── Helpers ─────────────────────────────────────────────
+
+    def _lookup(self, text: str, mood: str, user: str) -> Optional[int]:
+        """Slot holding text's response: exact match, else same-content near match."""
+        normalized = self._normalize(text)
+        slot = self._exact.get((mood, user, normalized))
+        if slot is not None:
+            return slot
+
+        slot = self._by_content.get((mood, user, self._content_words(normalized)))
+        if slot is None:
+            return None
+        vec = self._embed(normalized)
+        if vec is None or float(self._vecs[slot] @ vec) < self.threshold:
+            return None
+        return slot
+
+    def _forget(self, slot: int) -> None:
+        """Unlink slot from both indexes."""
+        keys = self._keys[slot]
+        if keys is None:
+            return
+        key, content_key = keys
+        del self._exact[key]
+        if self._by_content.get(content_key) == slot:
+            del self._by_content[content_key]
+        self._keys[slot] = None
+
+    def _touch(self, slot: int) -> None:
+        self._clock += 1
+        self._last_used[slot] = self._clock
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(_TOKEN_RE.findall(text.lower()))
+
+    @staticmethod
+    def _content_words(normalized: str) -> frozenset[str]:
+        return frozenset(w for w in normalized.split() if w not in _FILLER_WORDS)
+
+    def _embed(self, normalized: str) -> Optional[np.ndarray]:
+        """Signed feature-hashing embedding, L2-normalized."""
+        if not normalized:
+            return None
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for token in normalized.split():
+            h = zlib.crc32(token.encode("utf-8"))
+            vec[h % self.dim] += 1.0 if (h >> 31) & 1 else -1.0
+        norm = float(np.linalg.norm(vec))
+        if norm == 0.0:
+            return None
+        return vec / norm
@@ -1,6 +1,7 @@
 """Integration test for Franquenstein — tests the full cognitive cycle."""
 
 import os
+import sqlite3
 import sys
 import tempfile
 from contextlib import contextmanager
@@ -16,11 +17,15 @@ from franquenstein.memory.episodic import EpisodicMemory
 from franquenstein.memory.semantic import SemanticMemory
 from franquenstein.memory.emotional import EmotionalMemory
 from franquenstein.learning.patterns import PatternDetector
+from franquenstein.learning.metacognition import MetaCognition
 from franquenstein.growth.growth import GrowthSystem
 from franquenstein.perception.reader import read_document
 from franquenstein.perception.web import fetch_web_text
 from main import _learn_from_external_text
 from franquenstein.memory.backup import auto_backup
+from franquenstein.reasoning import ResponseCache
+from franquenstein.memory.memory import open_connection
+from franquenstein.neural.neural_graph import NeuralGraph
 
 
 @contextmanager
@@ -109,12 +114,71 @@ def test_memory_system():
         # Test state persistence
         memory.save_state("test_key", "test_value")
         assert memory.load_state("test_key") == "test_value"
+        memory.save_state_many({"test_key": "updated", "other_key": "42"})
+        assert memory.load_state("test_key") == "updated"
+        assert memory.load_state("other_key") == "42"
 
         memory.close()
 
     print("✅ PASSED")
 
 
+def test_memory_full_text_search():
+    """FTS search: word-prefix matching, literal operators, synced on update/delete."""
+    print("Testing Full-Text Search...", end=" ")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test_fts.db"
+
+        # A database from before the FTS indexes gets them rebuilt on open
+        conn = sqlite3.connect(str(db_path))
+        with open(Path(__file__).resolve().parent.parent / "franquenstein" / "memory" / "schema.sql",
+                  encoding="utf-8") as f:
+            conn.executescript(f.read())
+        conn.execute("INSERT INTO episodic_memory (input_text, output_text) VALUES ('old perro', 'guau')")
+        conn.execute("INSERT INTO semantic_memory (concept, definition) VALUES ('gato', 'old felino')")
+        conn.commit()
+        conn.close()
+
+        memory = MemorySystem(db_path=db_path)
+        assert memory.episodic._fts and memory.semantic._fts
+        assert [e.input_text for e in memory.episodic.search("perro")] == ["old perro"]
+        assert [c.concept for c in memory.semantic.search("felino")] == ["gato"]
+
+        # Prefix of a word hits; a fragment inside a word does not
+        episode_id = memory.episodic.store("mi perro ladra", "qué perro tan ruidoso")
+        memory.semantic.learn_concept("perro", "animal doméstico")
+        assert episode_id in [e.id for e in memory.episodic.search("perr")]
+        assert [c.concept for c in memory.semantic.search("domést")] == ["perro"]
+        assert memory.episodic.search("erro") == []
+        assert memory.semantic.search("méstico") == []
+
+        # FTS5 syntax in the query is searched literally, never parsed
+        for query in ['"perro', 'perro AND', 'NEAR(perro ladra)', 'perro OR -', 'input_text:perro', '*']:
+            memory.episodic.search(query)
+            memory.semantic.search(query)
+
+        # The index follows updated and deleted rows
+        memory._conn.execute(
+            "UPDATE episodic_memory SET input_text = 'mi loro', output_text = 'habla' WHERE id = ?",
+            (episode_id,),
+        )
+        memory.semantic.record_exploration("perro", "mamífero leal")
+        assert episode_id not in [e.id for e in memory.episodic.search("ladra")]
+        assert episode_id in [e.id for e in memory.episodic.search("loro")]
+        assert memory.semantic.search("doméstico") == []
+        assert [c.concept for c in memory.semantic.search("leal")] == ["perro"]
+
+        memory._conn.execute("DELETE FROM episodic_memory WHERE id = ?", (episode_id,))
+        memory._conn.execute("DELETE FROM semantic_memory WHERE concept = 'perro'")
+        memory._conn.commit()
+        assert memory.episodic.search("loro") == []
+        assert memory.semantic.search("leal") == []
+        memory.close()
+
+    print("✅ PASSED")
+
+
 def test_pattern_detection():
     """Test pattern detection."""
     print("Testing Pattern Detection...", end=" ")
@@ -148,6 +212,66 @@ def test_pattern_detection():
     print("✅ PASSED")
 
 
+def test_response_pattern_migration():
+    """JSON response lists from older databases move to response_variants intact."""
+    print("Testing Response Pattern Migration...", end=" ")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test_migration.db"
+        memory = MemorySystem(db_path=db_path)
+        memory._conn.execute(
+            "INSERT INTO patterns (pattern_type, pattern_key, pattern_value, confidence) "
+            "VALUES ('response_pattern', 'hello', ?, 0.8)",
+            ('{"responses": [{"output": "yo", "score": 0.8, "count": 1}, '
+             '{"output": "hi there!", "score": 0.5, "count": 2}]}',),
+        )
+        memory._conn.commit()
+
+        # The stable answer wins over the better-scored single shot
+        assert PatternDetector(memory._conn).get_best_response("hello") == "hi there!"
+        memory.close()
+
+        memory = MemorySystem(db_path=db_path)
+        detector = PatternDetector(memory._conn)
+        assert detector.get_best_response("hello") == "hi there!"
+        variants = memory._conn.execute(
+            "SELECT output, score, count FROM response_variants "
+            "WHERE pattern_key = 'hello' ORDER BY output"
+        ).fetchall()
+        assert variants == [("hi there!", 0.5, 2), ("yo", 0.8, 1)]
+        memory.close()
+
+    print("✅ PASSED")
+
+
+def test_reflections_log_migration():
+    """Reflections saved as one JSON array by older versions load into the log."""
+    print("Testing Reflections Migration...", end=" ")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test_reflections.db"
+        memory = MemorySystem(db_path=db_path)
+        memory.save_state("reflections", (
+            '[{"timestamp": "2024-01-01T10:00:00", "insight": "Good answer", '
+            '"category": "strength", "confidence": 0.7, "source_episodes": [1]}, '
+            '{"timestamp": "2024-01-02T10:00:00", "insight": "Bad answer", '
+            '"category": "weakness", "confidence": 0.6, "source_episodes": [2]}]'
+        ))
+
+        insights = [r.insight for r in MetaCognition(memory).get_recent_reflections()]
+        assert insights == ["Good answer", "Bad answer"]
+        assert memory.load_state("reflections_log").count("\n") == 2
+        memory.close()
+
+        memory = MemorySystem(db_path=db_path)
+        meta = MetaCognition(memory)
+        assert [r.insight for r in meta.get_recent_reflections()] == insights
+        assert [r.source_episodes for r in meta.get_weaknesses()] == [[2]]
+        memory.close()
+
+    print("✅ PASSED")
+
+
 def test_being_interaction():
     """Test the full being interaction cycle."""
     print("Testing Being Interaction...", end=" ")
@@ -320,7 +444,7 @@ def test_curiosity_step_generates_episode():
         assert being.level >= 2
 
         being._last_curiosity_ts = 0
-        being._curiosity_timestamps = []
+        being._curiosity_timestamps.clear()
 
         before = being.memory.episodic.count()
         result = being.curiosity_step()
@@ -347,7 +471,7 @@ def test_curiosity_throttling_guardrails():
         assert being.level >= 2
 
         being._last_curiosity_ts = 0
-        being._curiosity_timestamps = []
+        being._curiosity_timestamps.clear()
 
         first = being.curiosity_step()
         second = being.curiosity_step()
@@ -380,6 +504,15 @@ def test_auto_backup_utility():
         backups = sorted(db.parent.glob("memory_backup_*.db"))
         assert len(backups) <= 2
 
+    # A live SQLite database is copied through the online backup API
+    with tempfile.TemporaryDirectory() as tmpdir:
+        memory = MemorySystem(db_path=Path(tmpdir) / "memory.db")
+        memory.remember("back me up", "done")
+        backup = MemorySystem(db_path=auto_backup(memory._db_path))
+        assert backup.episodic.count() == 1
+        backup.close()
+        memory.close()
+
     print("✅ PASSED")
 
 
@@ -460,6 +593,51 @@ def test_neural_graph_offline_response():
     print("✅ PASSED")
 
 
+def test_neural_graphs_share_database():
+    """Two graphs on one database must see each other's writes, not stale state."""
+    print("Testing Shared Neural Database...", end=" ")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "shared_neural.db"
+        conn_a, conn_b = open_connection(db_path), open_connection(db_path)
+        try:
+            graph_a, graph_b = NeuralGraph(conn_a), NeuralGraph(conn_b)
+            graph_a.hebbian_learn(["dog", "bark"])
+            graph_a.hebbian_learn(["cheese", "milk"])
+
+            graph_b.activate(["cheese"])
+            graph_a.activate(["dog"])
+            fired = {n.label for n in graph_b.activate(["cheese"]).fired_nodes}
+            assert "cheese" in fired and "dog" not in fired
+
+            # Synapses learned by one graph reach the other's cached CSR
+            graph_a.connect("dog", "bone", weight=0.5)
+            fired = {n.label for n in graph_b.activate(["dog"]).fired_nodes}
+            assert "bone" in fired
+        finally:
+            conn_a.close()
+            conn_b.close()
+
+    print("✅ PASSED")
+
+
+def test_neural_csr_survives_turns():
+    """Commits that touch no synapses must not force a CSR rebuild each turn."""
+    print("Testing Neural CSR Reuse...", end=" ")
+
+    with isolated_being() as being:
+        builds = []
+        build_csr = being.neural._build_csr
+        being.neural._build_csr = lambda: (builds.append(1), build_csr())
+
+        for text in ["perro animal ladrar", "gato animal comida", "perro amigo", "perro"]:
+            being.interact(text)
+            being.give_feedback(0.7)
+        assert len(builds) == 1
+
+    print("✅ PASSED")
+
+
 def test_neurochemistry_modulates_graph_params():
     """Different neurochemical states should yield different graph params."""
     print("Testing Neurochemistry Modulation...", end=" ")
@@ -478,6 +656,39 @@ def test_neurochemistry_modulates_graph_params():
 
     print("✅ PASSED")
 
+
+def test_response_cache():
+    """Response cache should serve exact and near-duplicate inputs per mood and user."""
+    print("Testing Response Cache...", end=" ")
+
+    cache = ResponseCache(capacity=2)
+    cache.put("What is Python?", "curiosidad", "A programming language.")
+
+    assert cache.get("what is python", "curiosidad") == "A programming language."
+    assert cache.get("What is Python?", "frustracion") is None
+    assert cache.get("What is Python?", "curiosidad", user="Ana") is None
+    assert cache.get("Tell me about dogs", "curiosidad") is None
+
+    # Rephrasings only hit with the same content words
+    cache.put("what is the capital city of the country france", "neutral", "Paris")
+    assert cache.get("what is capital city of country france", "neutral") == "Paris"
+    assert cache.get("what is the capital city of the country spain", "neutral") is None
+
+    # Negative feedback evicts the rejected answer
+    assert not cache.discard("what is the capital city of the country france", "neutral", response="Rome")
+    assert cache.discard("what is the capital city of the country france", "neutral", response="Paris")
+    assert cache.get("what is the capital city of the country france", "neutral") is None
+
+    # LRU eviction keeps the most recently used entries
+    cache.put("first question", "neutral", "one")
+    cache.put("second question", "neutral", "two")
+    assert len(cache) == 2
+    assert cache.get("What is Python?", "curiosidad") is None
+    assert cache.get("second question", "neutral") == "two"
+
+    print("✅ PASSED")
+
+
 def test_persistence():
     """Test that state persists across sessions."""
     print("Testing Persistence...", end=" ")
@@ -487,7 +698,8 @@ def test_persistence():
 
         # Session 1: Create memories
         memory1 = MemorySystem(db_path=db_path)
-        memory1.remember("remember this", "okay I will", emotion="curiosidad")
+        episode_id = memory1.remember("remember this", "okay I will", emotion="curiosidad")
+        MetaCognition(memory1).evaluate_interaction(episode_id, 0.9)
         memory1.semantic.learn_concept("persistence", "Surviving across sessions")
         memory1.save_state("user_name", "TestUser")
         memory1.close()
@@ -497,11 +709,13 @@ def test_persistence():
         assert memory2.episodic.count() >= 1
         assert memory2.semantic.get_concept("persistence") is not None
         assert memory2.load_state("user_name") == "TestUser"
+        assert len(MetaCognition(memory2).get_strengths()) == 1
 
         # Verify recall works
         results = memory2.recall("remember")
         assert len(results["episodic"]) > 0
         memory2.close()
+        memory2.close()  # closing twice is a no-op
 
     print("✅ PASSED")
 
@@ -515,7 +729,10 @@ def main():
     tests = [
         test_working_memory,
         test_memory_system,
+        test_memory_full_text_search,
         test_pattern_detection,
+        test_response_pattern_migration,
+        test_reflections_log_migration,
         test_being_interaction,
         test_growth_system,
         test_llm_fallback_stability,
@@ -527,7 +744,10 @@ def main():
         test_auto_backup_utility,
         test_offline_response_patterns,
         test_neural_graph_offline_response,
+        test_neural_graphs_share_database,
+        test_neural_csr_survives_turns,
         test_neurochemistry_modulates_graph_params,
+        test_response_cache,
         test_persistence,
     ]
 